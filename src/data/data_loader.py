@@ -6,86 +6,262 @@ including team stats, rankings, and tournament results.
 """
 import pandas as pd
 import os
-from typing import Dict, Optional, Union, List
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Union, List, Tuple, Any
 
 
-def load_team_stats(year: int, data_dir: str = "data") -> pd.DataFrame:
+# Column dtypes of the scraped data files, so the CSV parser can allocate typed
+# buffers directly. Columns missing from a file are ignored and columns not listed
+# fall back to pandas' type inference.
+STATS_COLUMNS = [
+    "GP", "PTS", "FGM", "FGA", "FG%", "3PM", "3PA", "3P%", "FTM", "FTA", "FT%",
+    "OR", "DR", "REB", "AST", "STL", "BLK", "TO", "PF",
+]
+TEAM_STATS_DTYPES = {"Team": str, "StatsType": str, **{column: "float64" for column in STATS_COLUMNS}}
+RANKINGS_DTYPES = {"Team": str, "Record": str, "Poll": str, "Year": "Int64"}
+
+_DTYPES = {
+    'team_stats': TEAM_STATS_DTYPES,
+    'rankings': RANKINGS_DTYPES,
+}
+
+
+def _data_file_name(file_path: str) -> str:
+    """
+    Get the name of a data file without its extension (e.g., 'team_stats').
+    
+    Args:
+        file_path: Path to a Parquet, CSV or gzipped CSV data file
+        
+    Returns:
+        File name with the '.parquet', '.csv' or '.csv.gz' extension removed
+    """
+    name = os.path.basename(file_path)
+    if name.endswith(".gz"):
+        name = name[:-len(".gz")]
+    return os.path.splitext(name)[0]
+
+
+def _data_file_path(year: int, data_dir: str, name: str) -> str:
+    """
+    Get the path of a data file for a specific year.
+    
+    The newest of the Parquet, CSV and gzipped CSV files is used, so a file left
+    over from an earlier run never shadows fresher data. A Parquet copy is
+    preferred over a CSV file of the same age.
+    
+    Args:
+        year: The year of the data file
+        data_dir: Base directory for data
+        name: Name of the data file without extension (e.g., 'team_stats')
+        
+    Returns:
+        Path to the newest existing data file, or to the CSV file if there is none
+    """
+    base_path = os.path.join(data_dir, f"{year}", name)
+    # max() keeps the first of equally new files, so Parquet wins ties
+    candidates = [path for path in (f"{base_path}.parquet", f"{base_path}.csv", f"{base_path}.csv.gz")
+                  if os.path.exists(path)]
+    if not candidates:
+        return f"{base_path}.csv"
+    return max(candidates, key=os.path.getmtime)
+
+
+def _write_parquet_copy(df: pd.DataFrame, csv_path: str) -> None:
+    """
+    Write a Parquet copy next to a CSV file so later loads can skip CSV parsing.
+    
+    Args:
+        df: DataFrame read from the CSV file
+        csv_path: Path to the CSV file
+    """
+    parquet_path = os.path.join(os.path.dirname(csv_path), _data_file_name(csv_path) + ".parquet")
+    tmp_path = parquet_path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+    except ImportError:
+        # No Parquet engine installed, keep using the CSV file
+        pass
+    except Exception as e:
+        print(f"Warning: could not write Parquet copy of {csv_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_csv(file_path: str, dtype: Optional[Dict[str, Any]], columns: Optional[List[str]],
+              chunksize: Optional[int]) -> pd.DataFrame:
+    """
+    Read a CSV file, optionally in chunks to bound peak memory.
+    
+    Args:
+        file_path: Path to the CSV file
+        dtype: Column dtypes to parse with
+        columns: Columns to read, or None for all columns
+        chunksize: Number of rows to parse at a time, or None to parse the whole file at once
+        
+    Returns:
+        DataFrame with the file contents
+    """
+    reader = pd.read_csv(file_path, dtype=dtype, usecols=columns, chunksize=chunksize,
+                         low_memory=False, engine="c")
+    if chunksize is None:
+        return reader
+    with reader:
+        return pd.concat(reader, ignore_index=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_data_file_cached(file_path: str, mtime: float, columns: Optional[Tuple[str, ...]] = None,
+                           chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a Parquet or CSV data file, memoized on its path and modification time.
+    
+    Args:
+        file_path: Path to the data file
+        mtime: Modification time of the file, so edited files are re-read
+        columns: Columns to read, or None for all columns
+        chunksize: Number of CSV rows to parse at a time, or None to parse the whole file at once
+        
+    Returns:
+        DataFrame shared by all callers - never hand it out without copying
+    """
+    columns = list(columns) if columns is not None else None
+    if file_path.endswith(".parquet"):
+        return pd.read_parquet(file_path, columns=columns)
+    
+    dtype = _DTYPES.get(_data_file_name(file_path))
+    try:
+        df = _read_csv(file_path, dtype, columns, chunksize)
+    except (ValueError, TypeError) as e:
+        # The file does not match the expected schema, let pandas infer the types
+        print(f"Warning: {file_path} does not match the expected dtypes ({e}), inferring them")
+        df = _read_csv(file_path, None, columns, chunksize)
+    
+    # Only a full read is a faithful copy of the file
+    if columns is None:
+        _write_parquet_copy(df, file_path)
+    return df
+
+
+def _read_data_file(file_path: str, columns: Optional[List[str]] = None,
+                    chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a data file through the cache.
+    
+    Args:
+        file_path: Path to the data file
+        columns: Columns to read, or None for all columns
+        chunksize: Number of CSV rows to parse at a time, or None to parse the whole file at once
+        
+    Returns:
+        Copy of the cached DataFrame that callers can safely mutate
+    """
+    columns = tuple(columns) if columns is not None else None
+    return _read_data_file_cached(file_path, os.path.getmtime(file_path), columns, chunksize).copy()
+
+
+def clear_cache() -> None:
+    """Clear the cache of previously loaded data files."""
+    _read_data_file_cached.cache_clear()
+
+
+def load_team_stats(year: int, data_dir: str = "data", columns: Optional[List[str]] = None,
+                    chunksize: Optional[int] = None) -> pd.DataFrame:
     """
     Load team statistics for a specific year.
     
     Args:
         year: The year to load data for
         data_dir: Base directory for data
+        columns: Columns to load, or None for all columns
+        chunksize: Number of CSV rows to parse at a time to bound peak memory on
+            large files, or None to parse the whole file at once
         
     Returns:
         DataFrame containing team statistics
     """
     # Placeholder - implementation will depend on actual data structure
-    file_path = os.path.join(data_dir, f"{year}", "team_stats.csv")
+    file_path = _data_file_path(year, data_dir, "team_stats")
     if os.path.exists(file_path):
-        return pd.read_csv(file_path)
+        return _read_data_file(file_path, columns, chunksize)
     else:
         raise FileNotFoundError(f"Team stats file not found for year {year}")
 
 
-def load_rankings(year: int, data_dir: str = "data") -> pd.DataFrame:
+def load_rankings(year: int, data_dir: str = "data", columns: Optional[List[str]] = None,
+                  chunksize: Optional[int] = None) -> pd.DataFrame:
     """
     Load team rankings for a specific year.
     
     Args:
         year: The year to load rankings for
         data_dir: Base directory for data
+        columns: Columns to load, or None for all columns
+        chunksize: Number of CSV rows to parse at a time to bound peak memory on
+            large files, or None to parse the whole file at once
         
     Returns:
         DataFrame containing team rankings
     """
     # Placeholder - implementation will depend on actual data structure
-    file_path = os.path.join(data_dir, f"{year}", "rankings.csv")
+    file_path = _data_file_path(year, data_dir, "rankings")
     if os.path.exists(file_path):
-        return pd.read_csv(file_path)
+        return _read_data_file(file_path, columns, chunksize)
     else:
         raise FileNotFoundError(f"Rankings file not found for year {year}")
 
 
-def load_game_results(year: int, data_dir: str = "data") -> pd.DataFrame:
+def load_game_results(year: int, data_dir: str = "data", columns: Optional[List[str]] = None,
+                      chunksize: Optional[int] = None) -> pd.DataFrame:
     """
     Load game results for a specific year.
     
     Args:
         year: The year to load game results for
         data_dir: Base directory for data
+        columns: Columns to load, or None for all columns
+        chunksize: Number of CSV rows to parse at a time to bound peak memory on
+            large files, or None to parse the whole file at once
         
     Returns:
         DataFrame containing game results
     """
     # Placeholder - implementation will depend on actual data structure
-    file_path = os.path.join(data_dir, f"{year}", "games.csv")
+    file_path = _data_file_path(year, data_dir, "games")
     if os.path.exists(file_path):
-        return pd.read_csv(file_path)
+        return _read_data_file(file_path, columns, chunksize)
     else:
         raise FileNotFoundError(f"Game results file not found for year {year}")
 
 
-def load_tournament_data(year: int, data_dir: str = "data") -> pd.DataFrame:
+def load_tournament_data(year: int, data_dir: str = "data", columns: Optional[List[str]] = None,
+                         chunksize: Optional[int] = None) -> pd.DataFrame:
     """
     Load tournament data for a specific year.
     
     Args:
         year: The year to load tournament data for
         data_dir: Base directory for data
+        columns: Columns to load, or None for all columns
+        chunksize: Number of CSV rows to parse at a time to bound peak memory on
+            large files, or None to parse the whole file at once
         
     Returns:
         DataFrame containing tournament data
     """
     # Placeholder - implementation will depend on actual data structure
-    file_path = os.path.join(data_dir, f"{year}", "tournament.csv")
+    file_path = _data_file_path(year, data_dir, "tournament")
     if os.path.exists(file_path):
-        return pd.read_csv(file_path)
+        return _read_data_file(file_path, columns, chunksize)
     else:
         raise FileNotFoundError(f"Tournament file not found for year {year}")
 
 
-def load_multi_year_data(years: List[int], data_type: str, data_dir: str = "data") -> Dict[int, pd.DataFrame]:
+def load_multi_year_data(years: List[int], data_type: str, data_dir: str = "data",
+                         columns: Optional[List[str]] = None,
+                         chunksize: Optional[int] = None) -> Dict[int, pd.DataFrame]:
     """
     Load same type of data for multiple years.
     
@@ -93,6 +269,8 @@ def load_multi_year_data(years: List[int], data_type: str, data_dir: str = "data
         years: List of years to load data for
         data_type: Type of data to load ('team_stats', 'rankings', 'games', 'tournament')
         data_dir: Base directory for data
+        columns: Columns to load, or None for all columns
+        chunksize: Number of CSV rows to parse at a time, or None to parse each file at once
         
     Returns:
         Dictionary mapping years to DataFrames
@@ -108,10 +286,18 @@ def load_multi_year_data(years: List[int], data_type: str, data_dir: str = "data
         raise ValueError(f"Unknown data type: {data_type}. Must be one of {list(loaders.keys())}")
     
     result = {}
-    for year in years:
-        try:
-            result[year] = loaders[data_type](year, data_dir)
-        except FileNotFoundError as e:
-            print(f"Warning: {e}")
+    if not years:
+        return result
+    
+    # Load years concurrently - the file readers release the GIL while parsing
+    with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+        futures = {year: executor.submit(loaders[data_type], year, data_dir, columns, chunksize) for year in years}
+        
+        # Collect in the order requested so the result is deterministic
+        for year, future in futures.items():
+            try:
+                result[year] = future.result()
+            except FileNotFoundError as e:
+                print(f"Warning: {e}")
     
     return result 
\ No newline at end of file
@@ -5,34 +5,159 @@ This module scrapes opponent statistics from ESPN's website for men's college ba
 and saves the data as CSV files.
 """
 import os
-import time
+import sys
+import io
+import asyncio
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-import logging
+from lxml import etree
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
-import sys
-import os
+from typing import List, Dict, Optional, Tuple, Union, Iterator
 
 # Add the parent directory to the path so we can import espn_stats_scraper
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
-from espn_stats_scraper import ESPNStatsScraperBase, logger
+from espn_stats_scraper import ESPNSeleniumScraperBase, ESPNStatsScraperBase, coerce_numeric_columns, element_text, \
+    logger, strip_string_columns
+
+
+def _has_class(element: etree._Element, name: str) -> bool:
+    """Check whether an element has the given CSS class."""
+    return name in (element.get("class") or "").split()
+
+
+def _iter_table_rows(html: Union[str, bytes]) -> Iterator[Tuple[int, str, List[str]]]:
+    """
+    Stream the rows of the stats tables on a page without keeping the whole DOM.
+    
+    Rows are parsed one at a time and discarded once their cells have been read,
+    so memory use stays flat regardless of page size.
+    
+    Args:
+        html: Raw HTML content of the stats page
+        
+    Yields:
+        Tuples of (table index, 'thead' or 'tbody', raw cell texts) for every row of
+        the 'div.Wrapper > div.ResponsiveTable' containers, in document order
+    """
+    if not html:
+        return
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    
+    tables = []
+    for _, row in etree.iterparse(io.BytesIO(html), events=("end",), tag="tr", html=True):
+        section = row.getparent()
+        table = next((div for div in row.iterancestors("div") if _has_class(div, "ResponsiveTable")), None)
+        wrapper = table.getparent() if table is not None else None
+        
+        if section is not None and section.tag in ("thead", "tbody") and \
+                wrapper is not None and _has_class(wrapper, "Wrapper"):
+            # Rows of a table are contiguous, so a new container means the next table
+            if not tables or tables[-1] is not table:
+                tables.append(table)
+            cells = [element_text(cell) for cell in row if cell.tag in ("td", "th")]
+            yield len(tables) - 1, section.tag, cells
+        
+        # Free the rows that have already been processed
+        row.clear()
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+
+
+def _append_row(columns: Dict[str, List[str]], values: List[str]) -> None:
+    """
+    Append one table row to a column-oriented accumulator.
+    
+    Rows with missing trailing cells are padded with empty strings so that all
+    columns keep the same length.
+    
+    Args:
+        columns: Dictionary mapping column headers to lists of cell values
+        values: Cell values of the row, in header order
+    """
+    for i, column in enumerate(columns.values()):
+        column.append(values[i] if i < len(values) else "")
+
+
+def _collect_stats_tables(html: Union[str, bytes], teams: List[str], stats_cols: Dict[str, List[str]]) -> bool:
+    """
+    Stream the team and stats tables of a page into column accumulators.
+    
+    ESPN typically has two tables: one for teams and one for stats. The
+    accumulators can be reused across the pages of a paginated table.
+    
+    Args:
+        html: HTML content containing the 'div.Wrapper' stats tables
+        teams: List that team names are appended to
+        stats_cols: Dictionary mapping stats headers to cell values. Initialized from
+            the stats table headers if it is empty.
+        
+    Returns:
+        True if both the team and the stats table were found
+    """
+    table_count = 0
+    for table_index, section, cells in _iter_table_rows(html):
+        table_count = max(table_count, table_index + 1)
+        if table_index == 0 and section == "tbody":
+            # Team names table
+            if cells:
+                teams.append(cells[0])
+        elif table_index == 1 and section == "thead":
+            # Stats table headers, column by column so the DataFrame is built in one pass
+            if not stats_cols:
+                stats_cols.update((header.strip(), []) for header in cells)
+        elif table_index == 1 and section == "tbody":
+            # Stats table rows
+            if stats_cols:
+                _append_row(stats_cols, cells)
+    
+    return table_count >= 2
+
+
+def _build_opponent_stats(teams: List[str], stats_cols: Dict[str, List[str]]) -> pd.DataFrame:
+    """
+    Build the opponent stats DataFrame from accumulated table columns.
+    
+    Args:
+        teams: Team names, one per stats row
+        stats_cols: Dictionary mapping stats headers to cell values
+        
+    Returns:
+        DataFrame containing the opponent statistics, or an empty DataFrame if the
+        data is incomplete
+    """
+    if not stats_cols or not next(iter(stats_cols.values())):
+        logger.error("Failed to extract stats data")
+        return pd.DataFrame()
+    
+    stats_count = len(next(iter(stats_cols.values())))
+    if len(teams) != stats_count:
+        logger.error("Team count (%s) does not match stats count (%s)", len(teams), stats_count)
+        return pd.DataFrame()
+    
+    # Build teams, stats and a column indicating these are opponent stats in a single
+    # constructor call rather than concatenating frames and inserting columns
+    columns = {"Team": teams}
+    columns.update(stats_cols)
+    columns["StatsType"] = "Opponent"
+    return coerce_numeric_columns(strip_string_columns(pd.DataFrame(columns)))
 
 
 class ESPNMensBasketballOpponentStatsScraperMCB(ESPNStatsScraperBase):
     """Scraper for ESPN men's college basketball opponent stats."""
     
-    def __init__(self, output_dir: str = "data"):
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/stats/team/_/view/opponent",
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session
         )
     
     def scrape_opponent_stats(self, year: Optional[int] = None) -> pd.DataFrame:
@@ -45,74 +170,139 @@ class ESPNMensBasketballOpponentStatsScraperMCB(ESPNStatsScraperBase):
         Returns:
             DataFrame containing the opponent statistics
         """
-        url = self.base_url
-        if year is not None:
-            # The URL format for specific seasons (note: this might change)
-            url = f"{self.base_url}/season/{year}/seasontype/2"
+        url = self._year_url(year)
         
-        logger.info(f"Scraping opponent stats for {'current season' if year is None else year}")
+        logger.info("Scraping opponent stats for %s", 'current season' if year is None else year)
         
         # Get the page content
-        soup = self._get_page(url)
-        if not soup:
+        html = self._fetch(url)
+        if html is None:
             logger.error("Failed to retrieve page content")
             return pd.DataFrame()
         
-        # Find the stats tables - ESPN typically has two tables: one for teams and one for stats
-        tables = soup.select("div.Wrapper > div.ResponsiveTable")
-        if len(tables) < 2:
-            logger.error("Could not find stats tables on the page")
-            return pd.DataFrame()
+        return self._parse_opponent_stats(html)
+    
+    def _year_url(self, year: Optional[int] = None) -> str:
+        """
+        Build the opponent stats URL for a specific year.
         
-        # Team names table
-        team_table = tables[0]
-        # Stats table
-        stats_table = tables[1]
+        Args:
+            year: Year to build the URL for. If None, uses the current season.
+            
+        Returns:
+            URL of the opponent stats page
+        """
+        if year is None:
+            return self.base_url
+        # The URL format for specific seasons (note: this might change)
+        return f"{self.base_url}/season/{year}/seasontype/2"
+    
+    def _parse_opponent_stats(self, html: Union[str, bytes]) -> pd.DataFrame:
+        """
+        Parse raw HTML and extract opponent statistics from it.
         
-        # Extract team names
+        Args:
+            html: Raw HTML content of the opponent stats page
+            
+        Returns:
+            DataFrame containing the opponent statistics
+        """
         teams = []
-        team_rows = team_table.select("tbody > tr")
-        for row in team_rows:
-            team_cell = row.select_one("td:nth-of-type(1)")
-            if team_cell:
-                teams.append(team_cell.get_text(strip=True))
-        
-        # Extract stats
-        stats_rows = stats_table.select("tbody > tr")
-        headers = [th.get_text(strip=True) for th in stats_table.select("thead > tr > th")]
-        
-        stats_data = []
-        for row in stats_rows:
-            row_data = [td.get_text(strip=True) for td in row.select("td")]
-            stats_data.append(row_data)
-        
-        # Create stats DataFrame
-        if not stats_data or not headers:
-            logger.error("Failed to extract stats data")
+        stats_cols = {}
+        if not _collect_stats_tables(html, teams, stats_cols):
+            logger.error("Could not find stats tables on the page")
             return pd.DataFrame()
         
-        stats_df = pd.DataFrame(stats_data, columns=headers)
+        return _build_opponent_stats(teams, stats_cols)
+    
+    async def scrape_multiple_years_async(self, start_year: int, end_year: int, max_concurrency: int = 4,
+                                          force: bool = False) -> Dict[int, pd.DataFrame]:
+        """
+        Scrape opponent statistics for multiple years concurrently.
+        
+        Pages are fetched with aiohttp, bounded by a semaphore and throttled by the
+        host's shared token bucket to stay polite, and parsed in an executor so
+        parsing overlaps with in-flight requests. A progress bar shows the downloads.
         
-        # Create teams DataFrame
-        teams_df = pd.DataFrame({"Team": teams})
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            max_concurrency: Maximum number of concurrent requests
+            force: Scrape years again even if usable saved data exists
+            
+        Returns:
+            Dictionary mapping years to DataFrames containing opponent statistics
+        """
+        import aiohttp
+        from tqdm.asyncio import tqdm_asyncio
         
-        # Combine teams and stats
-        if len(teams_df) == len(stats_df):
-            result_df = pd.concat([teams_df, stats_df], axis=1)
-            # Add a column to indicate these are opponent stats
-            result_df['StatsType'] = 'Opponent'
-            return result_df
-        else:
-            logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
-            return pd.DataFrame()
+        results = {}
+        years = []
+        for year in range(start_year, end_year + 1):
+            filename = self._output_filename(f"mens_basketball_opponent_stats_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+            else:
+                years.append(year)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def scrape_year(session: aiohttp.ClientSession, year: int) -> pd.DataFrame:
+            logger.info("Scraping opponent data for %s", year)
+            html = await self._afetch(session, self._year_url(year), semaphore)
+            if html is None:
+                return pd.DataFrame()
+            return await loop.run_in_executor(None, self._parse_opponent_stats, html)
+        
+        async with self._client_session(max_concurrency) as session:
+            # Show the downloads' progress while keeping the results in year order
+            frames = await tqdm_asyncio.gather(*(scrape_year(session, year) for year in years),
+                                               desc="Opponent stats", unit="year")
+        
+        for year, df in zip(years, frames):
+            if not df.empty:
+                results[year] = df
+                filename = self._output_filename(f"mens_basketball_opponent_stats_{year}")
+                self._save(df, filename)
+            else:
+                logger.warning("No opponent data retrieved for %s", year)
+        
+        return dict(sorted(results.items()))
     
-    def scrape_multiple_years(self, start_year: int, end_year: int) -> Dict[int, pd.DataFrame]:
+    def scrape_multiple_years(self, start_year: int, end_year: int, force: bool = False) -> Dict[int, pd.DataFrame]:
         """
         Scrape opponent statistics for multiple years.
         
+        Uses concurrent aiohttp requests when aiohttp is installed, otherwise
+        falls back to fetching one year at a time.
+        
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
+            
+        Returns:
+            Dictionary mapping years to DataFrames containing opponent statistics
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            logger.warning("aiohttp is not installed, scraping years sequentially")
+            return self._scrape_multiple_years_sequential(start_year, end_year, force=force)
+        
+        return asyncio.run(self.scrape_multiple_years_async(start_year, end_year, force=force))
+    
+    def _scrape_multiple_years_sequential(self, start_year: int, end_year: int,
+                                          force: bool = False) -> Dict[int, pd.DataFrame]:
+        """
+        Scrape opponent statistics for multiple years, one year at a time.
+        
         Args:
             start_year: First year to scrape data for
             end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
             
         Returns:
             Dictionary mapping years to DataFrames containing opponent statistics
@@ -120,68 +310,52 @@ class ESPNMensBasketballOpponentStatsScraperMCB(ESPNStatsScraperBase):
         results = {}
         
         for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping opponent data for {year}")
+            filename = self._output_filename(f"mens_basketball_opponent_stats_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+                continue
+            
+            logger.info("Scraping opponent data for %s", year)
             df = self.scrape_opponent_stats(year)
             
             if not df.empty:
                 results[year] = df
-                filename = f"mens_basketball_opponent_stats_{year}.csv"
-                self._save_to_csv(df, filename)
+                self._save(df, filename)
             else:
-                logger.warning(f"No opponent data retrieved for {year}")
-            
-            # Wait between requests to avoid overloading the server
-            self._wait(2.0)
+                logger.warning("No opponent data retrieved for %s", year)
         
         return results
 
 
-class ESPNMensBasketballOpponentStatsScraperSelenium(ESPNStatsScraperBase):
+class ESPNMensBasketballOpponentStatsScraperSelenium(ESPNSeleniumScraperBase):
     """Scraper for ESPN men's college basketball opponent stats using Selenium."""
     
-    def __init__(self, output_dir: str = "data"):
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/stats/team/_/view/opponent",
-            output_dir=output_dir
-        )
-        # Import Selenium here so it's only required when this class is used
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        # Set up Selenium
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-        
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
+            output_dir=output_dir,
+            session=session
         )
-        self.wait = WebDriverWait(self.driver, 10)
-        self.By = By
-        self.EC = EC
     
-    def __del__(self):
-        """Clean up Selenium driver when the object is destroyed."""
-        try:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
-        except Exception as e:
-            logger.error(f"Error closing Selenium driver: {e}")
+    def _get_wrapper_html(self) -> str:
+        """
+        Get the HTML of the stats tables container in a single driver call.
+        
+        Returns:
+            Outer HTML of the 'div.Wrapper' element, or an empty string if missing
+        """
+        return self.driver.execute_script(
+            "const wrapper = document.querySelector('div.Wrapper');"
+            "return wrapper ? wrapper.outerHTML : '';"
+        )
     
     def scrape_opponent_stats(self, year: Optional[int] = None) -> pd.DataFrame:
         """
@@ -198,112 +372,63 @@ class ESPNMensBasketballOpponentStatsScraperSelenium(ESPNStatsScraperBase):
             # The URL format for specific seasons
             url = f"{self.base_url}/season/{year}/seasontype/2"
         
-        logger.info(f"Scraping opponent stats for {'current season' if year is None else year}")
+        logger.info("Scraping opponent stats for %s", 'current season' if year is None else year)
         
         try:
             # Navigate to the page
+            self._ensure_driver()
             self.driver.get(url)
             
             # Wait for the tables to load
             self.wait.until(self.EC.presence_of_element_located((self.By.CSS_SELECTOR, "div.ResponsiveTable")))
             
+            # Serialize the tables once per page and parse them in-process, instead of
+            # one driver round-trip per row and cell
+            teams = []
+            stats_cols = {}
+            if not _collect_stats_tables(self._get_wrapper_html(), teams, stats_cols):
+                logger.error("Could not find stats tables on the page")
+                return pd.DataFrame()
+            
             # If we need to navigate through pagination, do it here
             # Find the pagination control
             try:
                 pagination = self.driver.find_element(self.By.CSS_SELECTOR, "div.Pagination__Controls")
-                if pagination:
-                    # Get all data from all pages
-                    all_teams = []
-                    all_stats = []
-                    headers = []
-                    
-                    while True:
-                        # Extract team names from current page
-                        team_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(1)")
-                        team_rows = team_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                        
-                        for row in team_rows:
-                            team_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1)")
-                            all_teams.append(team_cell.text.strip())
-                        
-                        # Extract stats from current page
-                        stats_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(2)")
-                        stats_rows = stats_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                        
-                        # Get headers if this is the first page
-                        if not headers:
-                            headers = [th.text.strip() for th in stats_table.find_elements(self.By.CSS_SELECTOR, "thead > tr > th")]
-                        
-                        for row in stats_rows:
-                            row_data = [td.text.strip() for td in row.find_elements(self.By.CSS_SELECTOR, "td")]
-                            all_stats.append(row_data)
-                        
-                        # Try to go to the next page
-                        next_button = pagination.find_element(self.By.CSS_SELECTOR, "button[data-track='click:next']")
-                        if next_button and next_button.is_enabled():
-                            next_button.click()
-                            # Wait for the table to update
-                            time.sleep(1)
-                        else:
-                            break
-                    
-                    # Create DataFrame
-                    stats_df = pd.DataFrame(all_stats, columns=headers)
-                    teams_df = pd.DataFrame({"Team": all_teams})
-                    
-                    # Combine teams and stats
-                    if len(teams_df) == len(stats_df):
-                        result_df = pd.concat([teams_df, stats_df], axis=1)
-                        # Add a column to indicate these are opponent stats
-                        result_df['StatsType'] = 'Opponent'
-                        return result_df
+                while True:
+                    # Try to go to the next page
+                    next_button = pagination.find_element(self.By.CSS_SELECTOR, "button[data-track='click:next']")
+                    if next_button and next_button.is_enabled():
+                        old_first_row = self.driver.find_element(
+                            self.By.CSS_SELECTOR, "div.ResponsiveTable tbody tr"
+                        )
+                        next_button.click()
+                        # Wait until the old rows are replaced instead of sleeping a fixed time
+                        self.wait.until(self.EC.staleness_of(old_first_row))
+                        self.wait.until(self.EC.presence_of_element_located(
+                            (self.By.CSS_SELECTOR, "div.ResponsiveTable tbody tr")
+                        ))
+                        _collect_stats_tables(self._get_wrapper_html(), teams, stats_cols)
+                        pagination = self.driver.find_element(self.By.CSS_SELECTOR, "div.Pagination__Controls")
                     else:
-                        logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
-                        return pd.DataFrame()
+                        break
             except Exception as e:
-                # If pagination element is not found, just extract the data from the single page
-                logger.info(f"No pagination found or error navigating pages: {e}")
-                
-                # Extract data using Selenium from the current page
-                # Extract team names
-                team_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(1)")
-                team_rows = team_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                teams = [row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1)").text.strip() for row in team_rows]
-                
-                # Extract stats
-                stats_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(2)")
-                headers = [th.text.strip() for th in stats_table.find_elements(self.By.CSS_SELECTOR, "thead > tr > th")]
-                stats_rows = stats_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                stats_data = []
-                for row in stats_rows:
-                    row_data = [td.text.strip() for td in row.find_elements(self.By.CSS_SELECTOR, "td")]
-                    stats_data.append(row_data)
-                
-                # Create DataFrames
-                stats_df = pd.DataFrame(stats_data, columns=headers)
-                teams_df = pd.DataFrame({"Team": teams})
-                
-                # Combine teams and stats
-                if len(teams_df) == len(stats_df):
-                    result_df = pd.concat([teams_df, stats_df], axis=1)
-                    # Add a column to indicate these are opponent stats
-                    result_df['StatsType'] = 'Opponent'
-                    return result_df
-                else:
-                    logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
-                    return pd.DataFrame()
+                # If pagination element is not found, the single page holds all the data
+                logger.info("No pagination found or error navigating pages: %s", e)
+            
+            return _build_opponent_stats(teams, stats_cols)
         
         except Exception as e:
-            logger.error(f"Error scraping opponent stats: {e}")
+            logger.error("Error scraping opponent stats: %s", e)
             return pd.DataFrame()
     
-    def scrape_multiple_years(self, start_year: int, end_year: int) -> Dict[int, pd.DataFrame]:
+    def scrape_multiple_years(self, start_year: int, end_year: int, force: bool = False) -> Dict[int, pd.DataFrame]:
         """
         Scrape opponent statistics for multiple years.
         
         Args:
             start_year: First year to scrape data for
             end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
             
         Returns:
             Dictionary mapping years to DataFrames containing opponent statistics
@@ -311,15 +436,20 @@ class ESPNMensBasketballOpponentStatsScraperSelenium(ESPNStatsScraperBase):
         results = {}
         
         for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping opponent data for {year}")
+            filename = self._output_filename(f"mens_basketball_opponent_stats_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+                continue
+            
+            logger.info("Scraping opponent data for %s", year)
             df = self.scrape_opponent_stats(year)
             
             if not df.empty:
                 results[year] = df
-                filename = f"mens_basketball_opponent_stats_{year}.csv"
-                self._save_to_csv(df, filename)
+                self._save(df, filename)
             else:
-                logger.warning(f"No opponent data retrieved for {year}")
+                logger.warning("No opponent data retrieved for %s", year)
             
             # Wait between requests to avoid overloading the server
             self._wait(2.0)
@@ -340,6 +470,12 @@ def main():
                         help='Directory to save the scraped data')
     parser.add_argument('--use-selenium', action='store_true',
                         help='Use Selenium for scraping (required for JavaScript-rendered content)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Clear the HTML cache and fetch all pages again')
+    parser.add_argument('--csv', action='store_true',
+                        help='Save the scraped data as CSV instead of parquet')
+    parser.add_argument('--force', action='store_true',
+                        help='Scrape years again even if usable saved data exists')
     
     args = parser.parse_args()
     
@@ -347,10 +483,17 @@ def main():
         logger.info("Using Selenium scraper for opponent stats")
         scraper = ESPNMensBasketballOpponentStatsScraperSelenium(output_dir=args.output_dir)
     else:
-        logger.info("Using requests/BeautifulSoup scraper for opponent stats")
+        logger.info("Using requests/lxml scraper for opponent stats")
         scraper = ESPNMensBasketballOpponentStatsScraperMCB(output_dir=args.output_dir)
     
-    scraper.scrape_multiple_years(args.start_year, args.end_year)
+    if args.csv:
+        scraper.output_format = 'csv'
+    
+    if args.refresh:
+        scraper.clear_cache()
+    
+    with scraper:
+        scraper.scrape_multiple_years(args.start_year, args.end_year, force=args.force)
 
 
 if __name__ == "__main__":
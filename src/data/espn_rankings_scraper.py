@@ -5,190 +5,409 @@ This module scrapes team rankings from ESPN and other sources for men's college
 and saves the data as CSV files.
 """
 import os
-import time
+import re
+import csv
+import asyncio
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
-import logging
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 import sys
 
 # Add the parent directory to the path so we can import espn_stats_scraper
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
-from espn_stats_scraper import ESPNStatsScraperBase, logger
+from espn_stats_scraper import ESPNSeleniumScraperBase, ESPNStatsScraperBase, logger, json_loads
+
+
+# Map ESPN's poll types to the poll names used in the saved data
+POLL_TYPES = {'ap': 'AP', 'usa': 'Coaches'}
+
+# Bootstrap state embedded in ESPN pages, either as a window['__espnfitt__']
+# assignment or as the body of a script tag with that id
+_ESPNFITT_RE = re.compile(rb"""__espnfitt__(?:'\])?(?:"[^>]*>|\s*=\s*)(\{.*?\});?\s*</script>""", re.S)
+
+
+def _polls_from_json(polls: List[Dict[str, Any]], year: int) -> Dict[str, pd.DataFrame]:
+    """
+    Build poll DataFrames from ESPN's JSON rankings records.
+    
+    Args:
+        polls: List of poll objects, each with a 'type' and a list of 'ranks'
+        year: Year of the rankings
+        
+    Returns:
+        Dictionary mapping poll names to DataFrames containing rankings
+    """
+    results = {}
+    for poll in polls:
+        poll_name = POLL_TYPES.get(poll.get("type"))
+        if poll_name is None or poll_name in results:
+            continue
+        
+        ranks, teams, records, points = [], [], [], []
+        for entry in poll.get("ranks", []):
+            team = entry.get("team", {})
+            team_name = team.get("nickname") or team.get("location")
+            if entry.get("current") is None or not team_name:
+                continue
+            ranks.append(str(entry["current"]))
+            teams.append(team_name)
+            records.append(entry.get("recordSummary", ""))
+            # Points are floats in the JSON; format them like the HTML pages
+            poll_points = entry.get("points")
+            points.append(f"{poll_points:g}" if isinstance(poll_points, (int, float)) else "")
+        
+        if not ranks:
+            logger.error("Failed to extract %s rankings data", poll_name)
+            continue
+        
+        # Year and Poll are broadcast from scalars when the frame is built
+        results[poll_name] = pd.DataFrame({
+            "Rank": ranks,
+            "Team": teams,
+            "Record": records,
+            "Points": points,
+            "Year": year,
+            "Poll": poll_name
+        })
+    
+    return results
+
+
+def _find_polls(state: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Find the list of polls in ESPN's page bootstrap state.
+    
+    The exact location of the rankings differs between page versions, so look for
+    the first 'rankings' list whose items carry 'ranks'.
+    
+    Args:
+        state: Decoded bootstrap state, or any value nested inside it
+        
+    Returns:
+        List of poll objects, or None if the state contains no rankings
+    """
+    if isinstance(state, dict):
+        polls = state.get("rankings")
+        if isinstance(polls, list) and polls and isinstance(polls[0], dict) and "ranks" in polls[0]:
+            return polls
+        children = state.values()
+    elif isinstance(state, list):
+        children = state
+    else:
+        return None
+    
+    for child in children:
+        polls = _find_polls(child)
+        if polls is not None:
+            return polls
+    return None
+
+
+def _bootstrap_polls(html: bytes) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read the polls from the __espnfitt__ bootstrap state embedded in a page.
+    
+    Args:
+        html: Raw HTML content of the rankings page
+        
+    Returns:
+        List of poll objects, or None if the page has no usable bootstrap state
+    """
+    match = _ESPNFITT_RE.search(html)
+    if match is None:
+        return None
+    try:
+        state = json_loads(match.group(1))
+    except ValueError as e:
+        logger.warning("Failed to decode __espnfitt__ state: %s", e)
+        return None
+    return _find_polls(state)
+
+
+def _rank_and_team_spans(cell: LexborNode) -> Tuple[Optional[LexborNode], Optional[LexborNode]]:
+    """
+    Find the rank and team name spans of a rankings row's first cell.
+    
+    Equivalent to the selectors 'span' and 'span.ml4' on the cell, but found in one
+    walk over its descendants instead of compiling two selectors for every row.
+    
+    Args:
+        cell: First 'td' node of a rankings row
+        
+    Returns:
+        Tuple of (rank span, team name span), either of which may be None
+    """
+    rank_span = None
+    for node in cell.traverse():
+        if node.tag != "span":
+            continue
+        if rank_span is None:
+            rank_span = node
+        if "ml4" in (node.attributes.get("class") or "").split():
+            return rank_span, node
+    return rank_span, None
+
+
+def _save_rankings(output_dir: str, results: Dict[str, pd.DataFrame], year: Optional[int] = None) -> None:
+    """
+    Write all rankings of a year to a single CSV file.
+    
+    Rows are streamed poll by poll with csv.writer, so no combined DataFrame has
+    to be built just to save it.
+    
+    Args:
+        output_dir: Directory to save the file to
+        results: Dictionary mapping poll names to DataFrames containing rankings
+        year: Year of the rankings
+    """
+    if not results:
+        logger.warning("No rankings data retrieved for %s", year if year else 'current season')
+        return
+    
+    file_path = os.path.join(output_dir, f"mens_basketball_rankings_{year if year else 'current'}.csv")
+    try:
+        logger.info("Saving data to %s", file_path)
+        with open(file_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(next(iter(results.values())).columns)
+            for df in results.values():
+                writer.writerows(df.itertuples(index=False, name=None))
+        logger.info("Successfully saved data to %s", file_path)
+    except Exception as e:
+        logger.error("Error saving data to %s: %s", file_path, e)
 
 
 class ESPNMensBasketballRankingsScraperMCB(ESPNStatsScraperBase):
     """Scraper for ESPN men's college basketball rankings."""
     
-    def __init__(self, output_dir: str = "data"):
+    # The __espnfitt__ state names teams by their JSON nickname, which is not always
+    # the name the rendered tables show, so it is only read when asked for
+    use_bootstrap = False
+    
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/rankings",
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session
         )
+        # Season used for rankings scraped without an explicit year
+        self.current_year = datetime.now().year
     
-    def scrape_ap_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
+    def _rankings_url(self, year: Optional[int] = None) -> str:
         """
-        Scrape AP poll rankings for a specific year.
+        Get the URL of the rankings page for a season.
+        
+        The page holds both the AP and the Coaches poll tables, so it only needs to
+        be fetched and parsed once per season.
         
         Args:
-            year: Year to scrape data for (e.g., 2023). If None, gets current season.
+            year: Year of the season, or None for the current season
             
         Returns:
-            DataFrame containing AP rankings
+            URL of the rankings page
         """
-        url = self.base_url
-        if year is not None:
-            # The URL format for specific seasons (note: this might change)
-            url = f"{self.base_url}_/season/{year}"
-        
-        logger.info(f"Scraping AP rankings for {'current season' if year is None else year}")
+        if year is None:
+            return self.base_url
+        # The URL format for specific seasons (note: this might change)
+        return f"{self.base_url}/_/week/1/year/{year}/seasontype/2"
+    
+    def _extract_poll(self, tree: LexborHTMLParser, table_index: int, poll_name: str,
+                      year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract one poll from a parsed rankings page.
         
-        # Get the page content
-        soup = self._get_page(url)
-        if not soup:
-            logger.error("Failed to retrieve page content")
+        Args:
+            tree: Parsed rankings page
+            table_index: Index of the poll's table on the page (0 for AP, 1 for Coaches)
+            poll_name: Name of the poll (e.g., 'AP', 'Coaches')
+            year: Year of the rankings
+            
+        Returns:
+            DataFrame containing rankings data
+        """
+        # Find the rankings tables - AP Poll is typically the first, Coaches Poll the second
+        tables = tree.css("section.Rankings > div.tabs__content")
+        if len(tables) <= table_index:
+            logger.error("Could not find %s poll table on the page", poll_name)
             return pd.DataFrame()
         
-        # Find the rankings table - AP Poll is typically the first table
-        tables = soup.select("section.Rankings > div.tabs__content")
-        if not tables:
-            logger.error("Could not find rankings tables on the page")
-            return pd.DataFrame()
+        return self._parse_rankings_table(tables[table_index], poll_name, year)
+    
+    def _bootstrap_results(self, html: bytes, year: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Read every poll from the __espnfitt__ state embedded in a rankings page.
+        
+        The page embeds the rankings as JSON, which is cheaper and sturdier to read
+        than the rendered tables.
+        
+        Args:
+            html: Raw HTML content of the rankings page
+            year: Year of the rankings
+            
+        Returns:
+            Dictionary mapping poll names to DataFrames containing rankings, empty if
+            the page has no usable bootstrap state
+        """
+        polls = _bootstrap_polls(html)
+        if polls is None:
+            return {}
+        return _polls_from_json(polls, year or self.current_year)
+    
+    def _parse_poll(self, html: bytes, table_index: int, poll_name: str,
+                    year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract one poll from a rankings page, like _parse_all_polls does for all of them.
+        
+        Args:
+            html: Raw HTML content of the rankings page
+            table_index: Index of the poll's table on the page (0 for AP, 1 for Coaches)
+            poll_name: Name of the poll (e.g., 'AP', 'Coaches')
+            year: Year of the rankings
+            
+        Returns:
+            DataFrame containing rankings data
+        """
+        if self.use_bootstrap:
+            df = self._bootstrap_results(html, year).get(poll_name)
+            if df is not None:
+                return df
+        return self._extract_poll(LexborHTMLParser(html), table_index, poll_name, year)
+    
+    def _parse_all_polls(self, html: bytes, year: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Parse a rankings page once and extract every poll from it.
+        
+        With use_bootstrap set, uses the page's embedded __espnfitt__ state when it
+        holds the rankings and falls back to the rendered tables otherwise.
+        
+        Args:
+            html: Raw HTML content of the rankings page
+            year: Year of the rankings
+            
+        Returns:
+            Dictionary mapping poll names to DataFrames containing rankings
+        """
+        if self.use_bootstrap:
+            results = self._bootstrap_results(html, year)
+            if results:
+                return results
         
-        # AP Poll table
-        ap_table = tables[0]
+        tree = LexborHTMLParser(html)
         
-        # Extract teams and rankings
-        rankings_data = []
-        team_rows = ap_table.select("tbody > tr")
+        # Look up the poll tables once and hand each one to the row extractor
+        tables = tree.css("section.Rankings > div.tabs__content")
+        
+        results = {}
+        for table_index, poll_name in enumerate(('AP', 'Coaches')):
+            if table_index >= len(tables):
+                logger.error("Could not find %s poll table on the page", poll_name)
+                continue
+            df = self._parse_rankings_table(tables[table_index], poll_name, year)
+            if not df.empty:
+                results[poll_name] = df
+        return results
+    
+    def _parse_rankings_table(self, table: LexborNode, poll_name: str, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Extract ranking data from a rankings table.
+        
+        Args:
+            table: 'div.tabs__content' node holding the poll's table
+            poll_name: Name of the poll (e.g., 'AP', 'Coaches')
+            year: Year of the rankings
+            
+        Returns:
+            DataFrame containing rankings data
+        """
+        # The rank, team name and team abbreviation share the first cell, so
+        # pd.read_html would merge them into one string; walk the cells instead.
+        # Extract teams and rankings column by column so the DataFrame is built in one pass
+        ranks, teams, records, points = [], [], [], []
+        team_rows = table.css("tbody > tr")
         
         for row in team_rows:
-            try:
-                # Extract rank
-                rank_cell = row.select_one("td:nth-of-type(1) span")
-                if not rank_cell:
-                    continue
-                rank = rank_cell.get_text(strip=True)
-                
-                # Extract team name
-                team_cell = row.select_one("td:nth-of-type(1) span.ml4")
-                if not team_cell:
-                    continue
-                team = team_cell.get_text(strip=True)
-                
-                # Extract record
-                record_cell = row.select_one("td:nth-of-type(2)")
-                record = record_cell.get_text(strip=True) if record_cell else ""
-                
-                # Extract points
-                points_cell = row.select_one("td:nth-of-type(3)")
-                points = points_cell.get_text(strip=True) if points_cell else ""
-                
-                rankings_data.append({
-                    "Rank": rank,
-                    "Team": team,
-                    "Record": record,
-                    "Points": points
-                })
-            except Exception as e:
-                logger.error(f"Error extracting team data: {e}")
+            # Look up the row's cells once and index them, like td:nth-of-type(n)
+            cells = [cell for cell in row.iter() if cell.tag == "td"]
+            if not cells:
+                continue
+            
+            # Extract rank and team name
+            rank_cell, team_cell = _rank_and_team_spans(cells[0])
+            if rank_cell is None or team_cell is None:
+                continue
+            ranks.append(rank_cell.text(strip=True))
+            teams.append(team_cell.text(strip=True))
+            
+            # Extract record and points
+            records.append(cells[1].text(strip=True) if len(cells) > 1 else "")
+            points.append(cells[2].text(strip=True) if len(cells) > 2 else "")
         
         # Create DataFrame
-        if not rankings_data:
-            logger.error("Failed to extract rankings data")
+        if not ranks:
+            logger.error("Failed to extract %s rankings data", poll_name)
             return pd.DataFrame()
         
-        result_df = pd.DataFrame(rankings_data)
-        result_df['Year'] = year if year else datetime.now().year
-        result_df['Poll'] = 'AP'
+        # Year and Poll are broadcast from scalars when the frame is built
+        result_df = pd.DataFrame({
+            "Rank": ranks,
+            "Team": teams,
+            "Record": records,
+            "Points": points,
+            "Year": year or self.current_year,
+            "Poll": poll_name
+        })
         
         return result_df
     
-    def scrape_coaches_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
+    def scrape_ap_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
         """
-        Scrape Coaches poll rankings for a specific year.
+        Scrape AP poll rankings for a specific year.
         
         Args:
             year: Year to scrape data for (e.g., 2023). If None, gets current season.
             
         Returns:
-            DataFrame containing Coaches poll rankings
+            DataFrame containing AP rankings
         """
-        url = self.base_url
-        if year is not None:
-            # The URL format for specific seasons (note: this might change)
-            url = f"{self.base_url}/_/week/1/year/{year}/seasontype/2"
-        
-        logger.info(f"Scraping Coaches rankings for {'current season' if year is None else year}")
+        logger.info("Scraping AP rankings for %s", 'current season' if year is None else year)
         
         # Get the page content
-        soup = self._get_page(url)
-        if not soup:
+        html = self._fetch(self._rankings_url(year))
+        if html is None:
             logger.error("Failed to retrieve page content")
             return pd.DataFrame()
         
-        # Find the rankings table - Coaches Poll is typically the second table
-        tables = soup.select("section.Rankings > div.tabs__content")
-        if len(tables) < 2:
-            logger.error("Could not find Coaches poll table on the page")
-            return pd.DataFrame()
-        
-        # Coaches Poll table
-        coaches_table = tables[1]
-        
-        # Extract teams and rankings
-        rankings_data = []
-        team_rows = coaches_table.select("tbody > tr")
+        return self._parse_poll(html, 0, 'AP', year)
+    
+    def scrape_coaches_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Scrape Coaches poll rankings for a specific year.
         
-        for row in team_rows:
-            try:
-                # Extract rank
-                rank_cell = row.select_one("td:nth-of-type(1) span")
-                if not rank_cell:
-                    continue
-                rank = rank_cell.get_text(strip=True)
-                
-                # Extract team name
-                team_cell = row.select_one("td:nth-of-type(1) span.ml4")
-                if not team_cell:
-                    continue
-                team = team_cell.get_text(strip=True)
-                
-                # Extract record
-                record_cell = row.select_one("td:nth-of-type(2)")
-                record = record_cell.get_text(strip=True) if record_cell else ""
-                
-                # Extract points
-                points_cell = row.select_one("td:nth-of-type(3)")
-                points = points_cell.get_text(strip=True) if points_cell else ""
-                
-                rankings_data.append({
-                    "Rank": rank,
-                    "Team": team,
-                    "Record": record,
-                    "Points": points
-                })
-            except Exception as e:
-                logger.error(f"Error extracting team data: {e}")
+        Args:
+            year: Year to scrape data for (e.g., 2023). If None, gets current season.
+            
+        Returns:
+            DataFrame containing Coaches poll rankings
+        """
+        logger.info("Scraping Coaches rankings for %s", 'current season' if year is None else year)
         
-        # Create DataFrame
-        if not rankings_data:
-            logger.error("Failed to extract rankings data")
+        # Get the page content
+        html = self._fetch(self._rankings_url(year))
+        if html is None:
+            logger.error("Failed to retrieve page content")
             return pd.DataFrame()
         
-        result_df = pd.DataFrame(rankings_data)
-        result_df['Year'] = year if year else datetime.now().year
-        result_df['Poll'] = 'Coaches'
-        
-        return result_df
+        return self._parse_poll(html, 1, 'Coaches', year)
     
     def scrape_all_rankings(self, year: Optional[int] = None) -> Dict[str, pd.DataFrame]:
         """
@@ -200,25 +419,61 @@ class ESPNMensBasketballRankingsScraperMCB(ESPNStatsScraperBase):
         Returns:
             Dictionary mapping poll names to DataFrames containing rankings
         """
-        results = {}
+        logger.info("Scraping all rankings for %s", 'current season' if year is None else year)
         
-        # Scrape AP Poll rankings
-        ap_df = self.scrape_ap_rankings(year)
-        if not ap_df.empty:
-            results['AP'] = ap_df
-        
-        # Scrape Coaches Poll rankings
-        coaches_df = self.scrape_coaches_rankings(year)
-        if not coaches_df.empty:
-            results['Coaches'] = coaches_df
-        
-        # Combine all rankings into a single DataFrame
-        if results:
-            combined_df = pd.concat(results.values())
-            filename = f"mens_basketball_rankings_{year if year else 'current'}.csv"
-            self._save_to_csv(combined_df, filename)
+        # Both polls live on the same page, so fetch and parse it only once
+        html = self._fetch(self._rankings_url(year))
+        if html is None:
+            logger.error("Failed to retrieve page content")
+            results = {}
         else:
-            logger.warning(f"No rankings data retrieved for {year if year else 'current season'}")
+            results = self._parse_all_polls(html, year)
+        
+        _save_rankings(self.output_dir, results, year)
+        
+        return results
+    
+    async def scrape_multiple_years_async(self, start_year: int, end_year: int,
+                                          max_concurrency: int = 4) -> Dict[int, Dict[str, pd.DataFrame]]:
+        """
+        Scrape rankings for multiple years concurrently.
+        
+        Pages are fetched with aiohttp, bounded by a semaphore and throttled by the
+        host's shared token bucket to stay polite, and parsed in an executor so
+        parsing overlaps with in-flight requests. A progress bar shows the downloads.
+        
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            max_concurrency: Maximum number of concurrent requests
+            
+        Returns:
+            Dictionary mapping years to dictionaries of poll names to DataFrames
+        """
+        import aiohttp
+        from tqdm.asyncio import tqdm_asyncio
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def scrape_year(session: aiohttp.ClientSession, year: int) -> Dict[str, pd.DataFrame]:
+            logger.info("Scraping rankings for %s", year)
+            html = await self._afetch(session, self._rankings_url(year), semaphore)
+            if html is None:
+                return {}
+            return await loop.run_in_executor(None, self._parse_all_polls, html, year)
+        
+        years = list(range(start_year, end_year + 1))
+        async with self._client_session(max_concurrency) as session:
+            # Show the downloads' progress while keeping the results in year order
+            all_results = await tqdm_asyncio.gather(*(scrape_year(session, year) for year in years),
+                                                    desc="Rankings", unit="year")
+        
+        results = {}
+        for year, year_results in zip(years, all_results):
+            _save_rankings(self.output_dir, year_results, year)
+            if year_results:
+                results[year] = year_results
         
         return results
     
@@ -226,6 +481,9 @@ class ESPNMensBasketballRankingsScraperMCB(ESPNStatsScraperBase):
         """
         Scrape rankings for multiple years.
         
+        Uses concurrent aiohttp requests when aiohttp is installed, otherwise
+        falls back to fetching years on a thread pool.
+        
         Args:
             start_year: First year to scrape data for
             end_year: Last year to scrape data for
@@ -233,69 +491,153 @@ class ESPNMensBasketballRankingsScraperMCB(ESPNStatsScraperBase):
         Returns:
             Dictionary mapping years to dictionaries of poll names to DataFrames
         """
-        results = {}
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            logger.warning("aiohttp is not installed, scraping years on a thread pool")
+            return self._scrape_multiple_years_threaded(start_year, end_year)
         
-        for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping rankings for {year}")
-            year_results = self.scrape_all_rankings(year)
+        return asyncio.run(self.scrape_multiple_years_async(start_year, end_year))
+    
+    def _scrape_multiple_years_threaded(self, start_year: int, end_year: int,
+                                        max_workers: int = 4) -> Dict[int, Dict[str, pd.DataFrame]]:
+        """
+        Scrape rankings for multiple years on a pool of threads.
+        
+        The shared requests session is safe to use from several threads, and each
+        thread spends most of its time waiting on the network.
+        
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            max_workers: Maximum number of years scraped at the same time
             
-            if year_results:
-                results[year] = year_results
+        Returns:
+            Dictionary mapping years to dictionaries of poll names to DataFrames
+        """
+        def scrape_year(year: int) -> Dict[str, pd.DataFrame]:
+            # Requests are paced by the per-host rate limiter shared by all workers
+            logger.info("Scraping rankings for %s", year)
+            return self.scrape_all_rankings(year)
+        
+        years = list(range(start_year, end_year + 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(scrape_year, year): year for year in years}
+            all_results = {}
+            for future in as_completed(futures):
+                all_results[futures[future]] = future.result()
+        
+        results = {}
+        for year in years:
+            if all_results[year]:
+                results[year] = all_results[year]
             else:
-                logger.warning(f"No rankings data retrieved for {year}")
-            
-            # Wait between requests to avoid overloading the server
-            self._wait(2.0)
+                logger.warning("No rankings data retrieved for %s", year)
         
         return results
 
 
-class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
+class ESPNMensBasketballRankingsScraperAPI(ESPNMensBasketballRankingsScraperMCB):
+    """Scraper for ESPN men's college basketball rankings using ESPN's JSON API."""
+    
+    API_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/rankings"
+    
+    def _rankings_url(self, year: Optional[int] = None) -> str:
+        """
+        Get the URL of the rankings API for a season.
+        
+        Args:
+            year: Year of the season, or None for the current season
+            
+        Returns:
+            URL of the rankings API endpoint
+        """
+        if year is None:
+            return self.API_URL
+        return f"{self.API_URL}?season={year}&seasontype=2&week=1"
+    
+    def _parse_all_polls(self, html: bytes, year: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Extract every poll from a rankings API response.
+        
+        Args:
+            html: Raw JSON content of the API response
+            year: Year of the rankings
+            
+        Returns:
+            Dictionary mapping poll names to DataFrames containing rankings
+        """
+        try:
+            data = json_loads(html)
+        except ValueError as e:
+            logger.error("Failed to decode rankings API response: %s", e)
+            return {}
+        
+        return _polls_from_json(data.get("rankings", []), year or self.current_year)
+    
+    def _scrape_poll(self, poll_name: str, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Scrape a single poll from the rankings API.
+        
+        Args:
+            poll_name: Name of the poll (e.g., 'AP', 'Coaches')
+            year: Year to scrape data for (e.g., 2023). If None, gets current season.
+            
+        Returns:
+            DataFrame containing the poll's rankings
+        """
+        logger.info("Scraping %s rankings for %s", poll_name, 'current season' if year is None else year)
+        
+        content = self._fetch(self._rankings_url(year))
+        if content is None:
+            logger.error("Failed to retrieve rankings API response")
+            return pd.DataFrame()
+        
+        return self._parse_all_polls(content, year).get(poll_name, pd.DataFrame())
+    
+    def scrape_ap_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Scrape AP poll rankings for a specific year from the rankings API.
+        
+        Args:
+            year: Year to scrape data for (e.g., 2023). If None, gets current season.
+            
+        Returns:
+            DataFrame containing AP rankings
+        """
+        return self._scrape_poll('AP', year)
+    
+    def scrape_coaches_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Scrape Coaches poll rankings for a specific year from the rankings API.
+        
+        Args:
+            year: Year to scrape data for (e.g., 2023). If None, gets current season.
+            
+        Returns:
+            DataFrame containing Coaches poll rankings
+        """
+        return self._scrape_poll('Coaches', year)
+
+
+class ESPNMensBasketballRankingsScraperSelenium(ESPNSeleniumScraperBase):
     """Scraper for ESPN men's college basketball rankings using Selenium."""
     
-    def __init__(self, output_dir: str = "data"):
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/rankings",
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session
         )
-        # Import Selenium here so it's only required when this class is used
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        # Set up Selenium
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-        
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-        self.wait = WebDriverWait(self.driver, 10)
-        self.By = By
-        self.EC = EC
-    
-    def __del__(self):
-        """Clean up Selenium driver when the object is destroyed."""
-        try:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
-        except Exception as e:
-            logger.error(f"Error closing Selenium driver: {e}")
+        # Season used for rankings scraped without an explicit year
+        self.current_year = datetime.now().year
     
     def _get_ranking_data_from_table(self, table_index: int, poll_name: str, year: Optional[int] = None) -> pd.DataFrame:
         """
@@ -315,64 +657,72 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             tabs = self.driver.find_elements(self.By.CSS_SELECTOR, "section.Rankings ul.tabs__navigation li")
             
             if len(tabs) <= table_index:
-                logger.error(f"Could not find tab for {poll_name} rankings")
+                logger.error("Could not find tab for %s rankings", poll_name)
                 return pd.DataFrame()
             
             # Click on the appropriate tab
             tabs[table_index].click()
-            time.sleep(1)  # Wait for content to load
+            
+            # Wait until the selected poll's rows are shown instead of sleeping a fixed time
+            rows_xpath = (
+                "(//section[contains(concat(' ', normalize-space(@class), ' '), ' Rankings ')]"
+                "//div[contains(concat(' ', normalize-space(@class), ' '), ' tabs__content ')])"
+                f"[{table_index + 1}]//tbody/tr"
+            )
+            self.wait.until(self.EC.visibility_of_element_located((self.By.XPATH, rows_xpath)))
             
             # Find the rankings table
-            self.wait.until(self.EC.presence_of_element_located((self.By.CSS_SELECTOR, "section.Rankings div.tabs__content")))
             tables = self.driver.find_elements(self.By.CSS_SELECTOR, "section.Rankings div.tabs__content")
             
             if len(tables) <= table_index:
-                logger.error(f"Could not find {poll_name} rankings table")
+                logger.error("Could not find %s rankings table", poll_name)
                 return pd.DataFrame()
             
             rankings_table = tables[table_index]
-            team_rows = rankings_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-            
-            rankings_data = []
-            for row in team_rows:
-                try:
-                    # Extract rank
-                    rank_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1) span")
-                    rank = rank_cell.text.strip()
-                    
-                    # Extract team name
-                    team_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1) span.ml4")
-                    team = team_cell.text.strip()
-                    
-                    # Extract record
-                    record_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(2)")
-                    record = record_cell.text.strip()
-                    
-                    # Extract points
-                    points_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(3)")
-                    points = points_cell.text.strip()
-                    
-                    rankings_data.append({
-                        "Rank": rank,
-                        "Team": team,
-                        "Record": record,
-                        "Points": points
-                    })
-                except Exception as e:
-                    logger.error(f"Error extracting team data: {e}")
+            
+            # Read every row in a single driver call instead of one round-trip per cell
+            rows = self.driver.execute_script(
+                "const text = (row, selector) => {"
+                "  const cell = row.querySelector(selector);"
+                "  return cell ? cell.innerText.trim() : null;"
+                "};"
+                "return Array.from(arguments[0].querySelectorAll('tbody > tr'), row => ["
+                "  text(row, 'td:nth-of-type(1) span'),"
+                "  text(row, 'td:nth-of-type(1) span.ml4'),"
+                "  text(row, 'td:nth-of-type(2)'),"
+                "  text(row, 'td:nth-of-type(3)')"
+                "]);",
+                rankings_table
+            )
+            
+            # Collect the values column by column so the DataFrame is built in one pass
+            ranks, teams, records, points = [], [], [], []
+            for rank, team, record, row_points in rows:
+                if rank is None or team is None:
+                    continue
+                ranks.append(rank)
+                teams.append(team)
+                records.append(record or "")
+                points.append(row_points or "")
             
             # Create DataFrame
-            if not rankings_data:
-                logger.error(f"Failed to extract {poll_name} rankings data")
+            if not ranks:
+                logger.error("Failed to extract %s rankings data", poll_name)
                 return pd.DataFrame()
             
-            result_df = pd.DataFrame(rankings_data)
-            result_df['Year'] = year if year else datetime.now().year
-            result_df['Poll'] = poll_name
+            # Year and Poll are broadcast from scalars when the frame is built
+            result_df = pd.DataFrame({
+                "Rank": ranks,
+                "Team": teams,
+                "Record": records,
+                "Points": points,
+                "Year": year or self.current_year,
+                "Poll": poll_name
+            })
             
             return result_df
         except Exception as e:
-            logger.error(f"Error getting {poll_name} rankings data: {e}")
+            logger.error("Error getting %s rankings data: %s", poll_name, e)
             return pd.DataFrame()
     
     def scrape_ap_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
@@ -390,10 +740,11 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             # The URL format for specific seasons
             url = f"{self.base_url}/_/week/1/year/{year}/seasontype/2"
         
-        logger.info(f"Scraping AP rankings for {'current season' if year is None else year}")
+        logger.info("Scraping AP rankings for %s", 'current season' if year is None else year)
         
         try:
             # Navigate to the page
+            self._ensure_driver()
             self.driver.get(url)
             
             # Wait for the page to load
@@ -402,7 +753,7 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             # Extract data from AP Poll table (index 0)
             return self._get_ranking_data_from_table(0, 'AP', year)
         except Exception as e:
-            logger.error(f"Error scraping AP rankings: {e}")
+            logger.error("Error scraping AP rankings: %s", e)
             return pd.DataFrame()
     
     def scrape_coaches_rankings(self, year: Optional[int] = None) -> pd.DataFrame:
@@ -420,10 +771,11 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             # The URL format for specific seasons
             url = f"{self.base_url}/_/week/1/year/{year}/seasontype/2"
         
-        logger.info(f"Scraping Coaches rankings for {'current season' if year is None else year}")
+        logger.info("Scraping Coaches rankings for %s", 'current season' if year is None else year)
         
         try:
             # Navigate to the page if we're not already there
+            self._ensure_driver()
             if self.driver.current_url != url:
                 self.driver.get(url)
                 
@@ -433,7 +785,7 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             # Extract data from Coaches Poll table (index 1)
             return self._get_ranking_data_from_table(1, 'Coaches', year)
         except Exception as e:
-            logger.error(f"Error scraping Coaches rankings: {e}")
+            logger.error("Error scraping Coaches rankings: %s", e)
             return pd.DataFrame()
     
     def scrape_all_rankings(self, year: Optional[int] = None) -> Dict[str, pd.DataFrame]:
@@ -451,12 +803,13 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             # The URL format for specific seasons
             url = f"{self.base_url}/_/week/1/year/{year}/seasontype/2"
         
-        logger.info(f"Scraping all rankings for {'current season' if year is None else year}")
+        logger.info("Scraping all rankings for %s", 'current season' if year is None else year)
         
         results = {}
         
         try:
             # Navigate to the page
+            self._ensure_driver()
             self.driver.get(url)
             
             # Wait for the page to load
@@ -472,17 +825,11 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
             if not coaches_df.empty:
                 results['Coaches'] = coaches_df
             
-            # Combine all rankings into a single DataFrame
-            if results:
-                combined_df = pd.concat(results.values())
-                filename = f"mens_basketball_rankings_{year if year else 'current'}.csv"
-                self._save_to_csv(combined_df, filename)
-            else:
-                logger.warning(f"No rankings data retrieved for {year if year else 'current season'}")
+            _save_rankings(self.output_dir, results, year)
             
             return results
         except Exception as e:
-            logger.error(f"Error scraping all rankings: {e}")
+            logger.error("Error scraping all rankings: %s", e)
             return {}
     
     def scrape_multiple_years(self, start_year: int, end_year: int) -> Dict[int, Dict[str, pd.DataFrame]]:
@@ -499,13 +846,13 @@ class ESPNMensBasketballRankingsScraperSelenium(ESPNStatsScraperBase):
         results = {}
         
         for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping rankings for {year}")
+            logger.info("Scraping rankings for %s", year)
             year_results = self.scrape_all_rankings(year)
             
             if year_results:
                 results[year] = year_results
             else:
-                logger.warning(f"No rankings data retrieved for {year}")
+                logger.warning("No rankings data retrieved for %s", year)
             
             # Wait between requests to avoid overloading the server
             self._wait(2.0)
@@ -526,17 +873,32 @@ def main():
                         help='Directory to save the scraped data')
     parser.add_argument('--use-selenium', action='store_true',
                         help='Use Selenium for scraping (required for JavaScript-rendered content)')
+    parser.add_argument('--use-api', action='store_true',
+                        help='Read ESPN\'s JSON rankings API instead of the HTML pages')
+    parser.add_argument('--use-bootstrap', action='store_true',
+                        help='Read the rankings from the pages\' embedded __espnfitt__ state when present')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Clear the HTML cache and fetch all pages again')
     
     args = parser.parse_args()
     
     if args.use_selenium:
         logger.info("Using Selenium scraper for rankings")
         scraper = ESPNMensBasketballRankingsScraperSelenium(output_dir=args.output_dir)
+    elif args.use_api:
+        logger.info("Using ESPN JSON API scraper for rankings")
+        scraper = ESPNMensBasketballRankingsScraperAPI(output_dir=args.output_dir)
     else:
-        logger.info("Using requests/BeautifulSoup scraper for rankings")
+        logger.info("Using requests/selectolax scraper for rankings")
         scraper = ESPNMensBasketballRankingsScraperMCB(output_dir=args.output_dir)
+        scraper.use_bootstrap = args.use_bootstrap
     
-    scraper.scrape_multiple_years(args.start_year, args.end_year)
+    # Close the pooled HTTP session and quit Chrome once all years have been scraped
+    with scraper:
+        if args.refresh:
+            scraper.clear_cache()
+        
+        scraper.scrape_multiple_years(args.start_year, args.end_year)
 
 
 if __name__ == "__main__":
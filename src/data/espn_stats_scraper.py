@@ -5,13 +5,28 @@ This module scrapes team statistics from ESPN's website for men's college basket
 and saves the data as CSV files.
 """
 import os
+import json
 import time
+import gzip
+import random
+import shutil
+import asyncio
+import hashlib
+import threading
+from io import StringIO
+from functools import lru_cache
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union, Mapping
+from urllib.parse import urlparse
 
 
 # Set up logging
@@ -21,34 +36,409 @@ logging.basicConfig(
 )
 logger = logging.getLogger('espn_stats_scraper')
 
+# orjson decodes API responses faster than json when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# HTTP statuses that are retried with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def element_text(element: lxml_html.HtmlElement) -> str:
+    """
+    Get the raw text of an lxml element, like BeautifulSoup's get_text().
+    
+    The text is not stripped here; use strip_string_columns once the DataFrame has
+    been built instead of stripping every cell in Python. Most stat cells hold a
+    single text node, which is returned directly without walking the subtree.
+    
+    Args:
+        element: lxml element to extract the text from
+        
+    Returns:
+        Concatenation of the element's text fragments
+    """
+    if not len(element):
+        return element.text or ""
+    return "".join(element.itertext())
+
+
+def strip_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Strip surrounding whitespace from every string column in one vectorized pass.
+    
+    Args:
+        df: DataFrame of scraped values
+        
+    Returns:
+        The same DataFrame with its string columns stripped in place
+    """
+    str_cols = df.select_dtypes(include=["object", "string"]).columns
+    if len(str_cols):
+        df[str_cols] = df[str_cols].apply(lambda column: column.str.strip())
+    return df
+
+
+# Identifier columns that stay text even if every value looks like a number, so
+# they keep their dtype as merge keys
+KEY_COLUMNS = ("Team", "StatsType")
+
+
+def coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert scraped stat columns to numeric dtypes where possible.
+    
+    Thousands separators and trailing percent signs are stripped first. A column is
+    only converted if every non-empty value in it parses as a number, so text
+    columns are left untouched. The KEY_COLUMNS are never converted.
+    
+    Args:
+        df: DataFrame of scraped string values
+        
+    Returns:
+        The same DataFrame with numeric columns converted in place
+    """
+    for column in df.columns:
+        if column in KEY_COLUMNS or pd.api.types.is_numeric_dtype(df[column]):
+            continue
+        cleaned = df[column].str.replace(",", "", regex=False).str.rstrip("%")
+        numeric = pd.to_numeric(cleaned, errors="coerce")
+        if numeric.notna().sum() == (cleaned.str.len() > 0).sum():
+            df[column] = numeric
+    return df
+
+
+def _team_stats_from_json(data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Build a team stats DataFrame from ESPN's JSON team statistics.
+    
+    Args:
+        data: Decoded statistics API response, with the stat labels of each category
+            under 'categories' and the stat values of every team under 'teams'
+        
+    Returns:
+        DataFrame with a Team column followed by one column per statistic
+    """
+    labels = {category.get("name"): category.get("labels", []) for category in data.get("categories", [])}
+    
+    rows = []
+    for entry in data.get("teams", []):
+        team_name = entry.get("team", {}).get("displayName")
+        if not team_name:
+            continue
+        row = {"Team": team_name}
+        for category in entry.get("categories", []):
+            for label, value in zip(labels.get(category.get("name"), []), category.get("values", [])):
+                # Categories repeat some stats (e.g. GP); keep the first occurrence
+                row.setdefault(label, value)
+        rows.append(row)
+    
+    return pd.DataFrame(rows)
+
+
+# Held while the ChromeDriver path is looked up; lru_cache alone would let every
+# concurrent first caller run its own install
+_CHROME_DRIVER_LOCK = threading.Lock()
+
+
+def chrome_driver_path() -> str:
+    """
+    Get the path of the ChromeDriver binary, installing it on first use.
+    
+    ChromeDriverManager checks for driver updates over the network, so the path is
+    looked up once per process and shared by all Selenium scrapers, including ones
+    started concurrently on different threads.
+    
+    Returns:
+        Path to the ChromeDriver executable
+    """
+    with _CHROME_DRIVER_LOCK:
+        return _install_chrome_driver()
+
+
+@lru_cache(maxsize=None)
+def _install_chrome_driver() -> str:
+    """Install ChromeDriver and return its path; only called through chrome_driver_path."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def _class_test(name: str) -> str:
+    """Build an XPath predicate matching elements that have the given CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath expression for the stats tables, compiled once and reused for every page
+_STATS_TABLES = etree.XPath(f"//div[{_class_test('Wrapper')}]/div[{_class_test('ResponsiveTable')}]")
+
+
+def _read_table(table: lxml_html.HtmlElement) -> pd.DataFrame:
+    """
+    Read the HTML table inside an element into a DataFrame with pd.read_html.
+    
+    Args:
+        table: Element containing the <table>
+        
+    Returns:
+        DataFrame with the table's rows, with numeric columns already converted
+    """
+    markup = lxml_html.tostring(table, encoding="unicode")
+    return pd.read_html(StringIO(markup), flavor="lxml")[0]
+
+
+def _team_stats_from_tree(tree: lxml_html.HtmlElement) -> pd.DataFrame:
+    """
+    Extract team statistics from a parsed team stats page.
+    
+    Args:
+        tree: Root element of the team stats page
+        
+    Returns:
+        DataFrame containing the team statistics
+    """
+    # Find the stats tables - ESPN typically has two tables: one for teams and one for stats
+    tables = _STATS_TABLES(tree)
+    if len(tables) < 2:
+        logger.error("Could not find stats tables on the page")
+        return pd.DataFrame()
+    
+    # Team names table
+    team_table = tables[0]
+    # Stats table
+    stats_table = tables[1]
+    
+    # Let pandas build both tables, converting the numeric stat columns as it goes;
+    # the team name is the text of the first cell of each team row
+    try:
+        teams_df = _read_table(team_table).iloc[:, [0]]
+        stats_df = _read_table(stats_table)
+    except (ValueError, IndexError) as e:
+        logger.error("Failed to extract stats data: %s", e)
+        return pd.DataFrame()
+    
+    teams_df.columns = ["Team"]
+    
+    # Combine teams and stats
+    if len(teams_df) == len(stats_df):
+        result_df = pd.concat([teams_df, stats_df], axis=1)
+        return strip_string_columns(result_df)
+    else:
+        logger.error("Team count (%s) does not match stats count (%s)", len(teams_df), len(stats_df))
+        return pd.DataFrame()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that limits how often requests are sent."""
+    
+    def __init__(self, capacity: int = 5, period: float = 10.0):
+        """
+        Initialize the bucket with all of its tokens available.
+        
+        Args:
+            capacity: Maximum number of requests that can be sent in a burst
+            period: Number of seconds it takes to refill the whole bucket
+        """
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _try_acquire(self) -> float:
+        """
+        Take one token if the bucket has one.
+        
+        Returns:
+            0 if a token was taken, otherwise the number of seconds until one is available
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping only if the bucket is empty."""
+        while True:
+            delay = self._try_acquire()
+            if not delay:
+                return
+            time.sleep(delay)
+    
+    async def acquire_async(self) -> None:
+        """Take one token, yielding to the event loop while the bucket is empty."""
+        while True:
+            delay = self._try_acquire()
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+
+# Token buckets of every host being scraped, shared by all scraper instances
+_HOST_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 10, max_retries: int = 3,
+                   backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Create a requests session with pooled keep-alive connections that retries transient errors.
+    
+    One session can be shared by several scrapers (also from several threads) so
+    they reuse each other's connections instead of each doing its own TCP and TLS
+    handshakes.
+    
+    Args:
+        pool_connections: Number of hosts to keep connection pools for
+        pool_maxsize: Maximum number of connections kept open per host
+        max_retries: Number of retries for connection errors and RETRY_STATUSES
+        backoff_factor: Exponential backoff factor between retries
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=max_retries, backoff_factor=backoff_factor,
+                          status_forcelist=RETRY_STATUSES, respect_retry_after_header=True)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class ESPNStatsScraperBase:
     """Base class for ESPN stats scrapers."""
     
-    def __init__(self, base_url: str, output_dir: str = "data"):
+    # BeautifulSoup tree builder used by _parse_html; lxml's C parser is much faster
+    # than html.parser and handles the encoding of the raw page bytes itself
+    html_parser = 'lxml'
+    
+    # File format the scraped tables are saved in ('parquet' or 'csv'); zstd-compressed
+    # parquet is written in C by pyarrow instead of formatting every cell as text
+    output_format = 'parquet'
+    
+    # Whether fetches may be answered from the HTML cache; when False every page is
+    # downloaded again, but the fresh copies are still written to the cache
+    use_cache = True
+    
+    def __init__(self, base_url: str, output_dir: str = "data", cache_dir: Optional[str] = None,
+                 cache_ttl: float = 86400.0, session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             base_url: Base URL for the ESPN stats page
             output_dir: Directory to save the scraped data
+            cache_dir: Directory to cache raw HTML pages in. Defaults to
+                '<output_dir>/.cache/espn'.
+            cache_ttl: Number of seconds a cached page stays valid
+            session: Shared requests session (see create_session) to fetch with.
+                The caller keeps ownership and closes it; by default the scraper
+                creates and closes its own session.
         """
         self.base_url = base_url
         self.output_dir = output_dir
-        self.session = requests.Session()
+        self.cache_dir = cache_dir or os.path.join(output_dir, ".cache", "espn")
+        self.cache_ttl = cache_ttl
+        self.timeout = 10.0
+        # Retry policy shared by the requests session and the aiohttp fetches
+        self.max_retries = 3
+        self.backoff_factor = 0.5
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            # Ask for compressed pages, including brotli when a decoder is installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
             'Referer': 'https://www.espn.com/',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         
+        # Reuse pooled keep-alive connections across requests and retry transient errors
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(max_retries=self.max_retries, backoff_factor=self.backoff_factor)
+        self.session = session
+        self.session.headers.update(self.headers)
+        
+        # Per-host rate limits: short bursts go through, sustained scraping is throttled.
+        # The buckets are shared by all scrapers so concurrent scrapers stay within them.
+        self.rate_limiters: Dict[str, TokenBucket] = _HOST_RATE_LIMITERS
+        
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+    
+    def __enter__(self) -> 'ESPNStatsScraperBase':
+        """Use the scraper as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the scraper when leaving the context."""
+        self.close()
+    
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections, unless it is shared."""
+        if self._owns_session:
+            self.session.close()
+    
+    def _fetch(self, url: str) -> Optional[bytes]:
+        """
+        Get the raw HTML content of a page, using the HTML cache when possible.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Raw HTML content or None if the request failed
+        """
+        cached = self._read_cache(url)
+        if cached is not None:
+            logger.info("Using cached page for URL: %s", url)
+            return cached
+        
+        # Revalidate an expired cached page instead of downloading it again
+        stale, conditional_headers = self._stale_cache(url)
+        
+        self._rate_limiter(url).acquire()
+        try:
+            logger.info("Fetching URL: %s", url)
+            response = self.session.get(url, headers=conditional_headers, timeout=self.timeout)
+            if response.status_code == 304 and stale is not None:
+                logger.info("Cached page is still valid for URL: %s", url)
+                self._touch_cache(url)
+                return stale
+            response.raise_for_status()
+            self._write_cache(url, response.content, response.headers)
+            return response.content
+        except requests.exceptions.RequestException as e:
+            logger.error("Error fetching URL %s: %s", url, e)
+            return None
+    
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """
+        Get the token bucket limiting requests to the host of a URL.
+        
+        Args:
+            url: URL about to be fetched
+            
+        Returns:
+            Token bucket shared by all requests to the URL's host
+        """
+        host = urlparse(url).netloc
+        limiter = self.rate_limiters.get(host)
+        if limiter is None:
+            limiter = self.rate_limiters.setdefault(host, TokenBucket())
+        return limiter
     
     def _get_page(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -60,30 +450,359 @@ class ESPNStatsScraperBase:
         Returns:
             BeautifulSoup object or None if the request failed
         """
+        content = self._fetch(url)
+        if content is None:
+            return None
+        return self._parse_html(content)
+    
+    def _get_tree(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """
+        Get the HTML content of a page and parse it with lxml.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Root lxml element or None if the request failed
+        """
+        content = self._fetch(url)
+        if content is None:
+            return None
+        return self._parse_tree(content)
+    
+    def _parse_html(self, html: Union[str, bytes]) -> BeautifulSoup:
+        """
+        Parse raw HTML content with BeautifulSoup.
+        
+        Args:
+            html: Raw HTML content
+            
+        Returns:
+            BeautifulSoup object
+        """
+        if self.html_parser == 'html.parser':
+            return BeautifulSoup(html, 'html.parser')
         try:
-            logger.info(f"Fetching URL: {url}")
-            response = self.session.get(url, headers=self.headers)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching URL {url}: {e}")
+            return BeautifulSoup(html, self.html_parser)
+        except Exception as e:
+            # Fall back to the built-in parser if the faster one is missing or rejects the markup
+            logger.warning("Parsing with %s failed, falling back to html.parser: %s", self.html_parser, e)
+            return BeautifulSoup(html, 'html.parser')
+    
+    def _parse_tree(self, html: Union[str, bytes]) -> lxml_html.HtmlElement:
+        """
+        Parse raw HTML content with lxml.
+        
+        Args:
+            html: Raw HTML content
+            
+        Returns:
+            Root lxml element
+        """
+        return lxml_html.fromstring(html)
+    
+    def _cache_path(self, url: str) -> str:
+        """
+        Get the path of the cache file for a URL.
+        
+        Args:
+            url: URL of the cached page
+            
+        Returns:
+            Path to the gzipped cache file
+        """
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.html.gz")
+    
+    def _read_cache(self, url: str) -> Optional[bytes]:
+        """
+        Read a page from the HTML cache.
+        
+        Args:
+            url: URL of the cached page
+            
+        Returns:
+            Raw HTML content or None if the page is not cached or has expired
+        """
+        if not self.use_cache:
+            return None
+        path = self._cache_path(url)
+        if not os.path.exists(path) or time.time() - os.path.getmtime(path) > self.cache_ttl:
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        except (OSError, EOFError) as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", path, e)
             return None
     
+    def _stale_cache(self, url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """
+        Get an expired cached page together with headers to revalidate it.
+        
+        Args:
+            url: URL of the cached page
+            
+        Returns:
+            Tuple of (cached HTML content, conditional request headers). The content
+            is None and the headers are empty if the page cannot be revalidated.
+        """
+        if not self.use_cache:
+            return None, {}
+        path = self._cache_path(url)
+        try:
+            with open(f"{path}.meta", 'r') as f:
+                validators = json.load(f)
+            with gzip.open(path, 'rb') as f:
+                content = f.read()
+        except (OSError, EOFError, ValueError):
+            return None, {}
+        
+        headers = {}
+        if validators.get('ETag'):
+            headers['If-None-Match'] = validators['ETag']
+        if validators.get('Last-Modified'):
+            headers['If-Modified-Since'] = validators['Last-Modified']
+        if not headers:
+            return None, {}
+        return content, headers
+    
+    def _touch_cache(self, url: str) -> None:
+        """
+        Mark a cached page as fresh again after the server confirmed it is unchanged.
+        
+        Args:
+            url: URL of the cached page
+        """
+        try:
+            os.utime(self._cache_path(url))
+        except OSError as e:
+            logger.warning("Error refreshing cache entry for URL %s: %s", url, e)
+    
+    def _write_cache(self, url: str, content: bytes, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Write a page to the HTML cache.
+        
+        The response's ETag and Last-Modified headers are stored next to the page
+        so that it can be revalidated with a conditional request once it expires.
+        
+        Args:
+            url: URL of the page
+            content: Raw HTML content of the page
+            headers: Response headers of the page
+        """
+        path = self._cache_path(url)
+        validators = {name: headers[name] for name in ('ETag', 'Last-Modified') if headers and name in headers}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(path, 'wb') as f:
+                f.write(content)
+            if validators:
+                with open(f"{path}.meta", 'w') as f:
+                    json.dump(validators, f)
+            elif os.path.exists(f"{path}.meta"):
+                os.remove(f"{path}.meta")
+        except OSError as e:
+            logger.warning("Error caching URL %s to %s: %s", url, path, e)
+    
+    def clear_cache(self) -> None:
+        """Delete all cached HTML pages so they are fetched again."""
+        if os.path.exists(self.cache_dir):
+            logger.info("Clearing HTML cache in %s", self.cache_dir)
+            shutil.rmtree(self.cache_dir)
+    
+    def _client_session(self, max_concurrency: int) -> Any:
+        """
+        Create an aiohttp session with pooled keep-alive connections.
+        
+        Args:
+            max_concurrency: Maximum number of concurrent requests, used as the
+                per-host connection limit
+            
+        Returns:
+            aiohttp.ClientSession to fetch with
+        """
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector)
+    
+    async def _afetch(self, session: Any, url: str, semaphore: asyncio.Semaphore) -> Optional[bytes]:
+        """
+        Asynchronously fetch the HTML content of a page.
+        
+        Args:
+            session: aiohttp.ClientSession to fetch with
+            url: URL to fetch
+            semaphore: Semaphore bounding the number of concurrent requests
+            
+        Returns:
+            Raw HTML content or None if the request failed
+        """
+        import aiohttp
+        
+        cached = self._read_cache(url)
+        if cached is not None:
+            logger.info("Using cached page for URL: %s", url)
+            return cached
+        
+        # Revalidate an expired cached page instead of downloading it again
+        stale, conditional_headers = self._stale_cache(url)
+        
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                delay = None
+                # Every attempt counts against the host's rate limit, as in _fetch
+                await self._rate_limiter(url).acquire_async()
+                try:
+                    logger.info("Fetching URL: %s", url)
+                    async with session.get(url, headers=conditional_headers) as response:
+                        if response.status == 304 and stale is not None:
+                            logger.info("Cached page is still valid for URL: %s", url)
+                            self._touch_cache(url)
+                            return stale
+                        if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                            # Back off like the requests session's Retry policy, honouring Retry-After
+                            retry_after = response.headers.get("Retry-After", "")
+                            delay = float(retry_after) if retry_after.isdigit() else self.backoff_factor * 2 ** attempt
+                            reason = f"Got status {response.status}"
+                        else:
+                            response.raise_for_status()
+                            html = await response.read()
+                            response_headers = response.headers
+                except asyncio.TimeoutError:
+                    # A slow response is transient like a retryable status; give up
+                    # on this page only once the retries are used up
+                    if attempt == self.max_retries:
+                        logger.error("Timed out fetching URL %s", url)
+                        return None
+                    delay = self.backoff_factor * 2 ** attempt
+                    reason = "Timed out"
+                except aiohttp.ClientError as e:
+                    logger.error("Error fetching URL %s: %s", url, e)
+                    return None
+                
+                if delay is None:
+                    break
+                logger.warning("%s for URL %s, retrying in %.1fs", reason, url, delay)
+                await asyncio.sleep(delay)
+            
+            self._write_cache(url, html, response_headers)
+            # Jitter between requests to avoid overloading the server
+            await asyncio.sleep(random.uniform(0.5, 1.5))
+            return html
+    
+    def _output_filename(self, name: str) -> str:
+        """
+        Get the file name to save a table under in the configured output format.
+        
+        Args:
+            name: File name without extension
+            
+        Returns:
+            File name with the extension of the output format
+        """
+        return f"{name}.{self.output_format}"
+    
+    def _save(self, df: pd.DataFrame, filename: str) -> None:
+        """
+        Save DataFrame to a CSV or parquet file, depending on the file extension.
+        
+        Args:
+            df: DataFrame to save
+            filename: Name of the file to save to
+        """
+        if not filename.endswith(".parquet"):
+            self._save_to_csv(df, filename)
+            return
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.warning("pyarrow is not installed, saving data as CSV instead")
+            self._save_to_csv(df, os.path.splitext(filename)[0] + ".csv")
+            return
+        
+        file_path = os.path.join(self.output_dir, filename)
+        try:
+            logger.info("Saving data to %s", file_path)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, file_path, compression='zstd', use_dictionary=True)
+            logger.info("Successfully saved data to %s", file_path)
+        except Exception as e:
+            logger.error("Error saving data to %s: %s", file_path, e)
+    
     def _save_to_csv(self, df: pd.DataFrame, filename: str) -> None:
         """
         Save DataFrame to CSV file.
         
+        The CSV is written by pyarrow's C writer when pyarrow is installed and can
+        convert the frame; otherwise pandas' to_csv is used.
+        
         Args:
             df: DataFrame to save
             filename: Name of the file to save to
         """
         file_path = os.path.join(self.output_dir, filename)
         try:
-            logger.info(f"Saving data to {file_path}")
-            df.to_csv(file_path, index=False)
-            logger.info(f"Successfully saved data to {file_path}")
+            logger.info("Saving data to %s", file_path)
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pa_csv
+                # Arrow raises TypeError/ValueError subclasses for columns of mixed types
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (ImportError, TypeError, ValueError):
+                df.to_csv(file_path, index=False)
+            else:
+                pa_csv.write_csv(table, file_path)
+            logger.info("Successfully saved data to %s", file_path)
+        except Exception as e:
+            logger.error("Error saving data to %s: %s", file_path, e)
+    
+    def _load_saved(self, filename: str, max_age: float = 7 * 86400.0) -> Optional[pd.DataFrame]:
+        """
+        Load previously saved data if the file exists and is recent enough.
+        
+        Args:
+            filename: Name of the file the data was saved to
+            max_age: Maximum age of the file in seconds
+            
+        Returns:
+            DataFrame with the saved data or None if it has to be scraped again
+        """
+        file_path = os.path.join(self.output_dir, filename)
+        if not os.path.exists(file_path) or time.time() - os.path.getmtime(file_path) > max_age:
+            return None
+        try:
+            logger.info("Using previously saved data from %s", file_path)
+            if file_path.endswith(".parquet"):
+                return pd.read_parquet(file_path)
+            return pd.read_csv(file_path)
         except Exception as e:
-            logger.error(f"Error saving data to {file_path}: {e}")
+            logger.warning("Error loading saved data from %s: %s", file_path, e)
+            return None
+    
+    def _saved_max_age(self, year: int, filename: str) -> float:
+        """
+        Get how long previously saved data for a season can be reused.
+        
+        Stats of a finished season no longer change, so data saved after the season
+        ended never expires; anything else is scraped again once it is a week old.
+        
+        Args:
+            year: Year of the season
+            filename: Name of the file the data was saved to
+            
+        Returns:
+            Maximum age of the saved data in seconds
+        """
+        file_path = os.path.join(self.output_dir, filename)
+        season_end = datetime(year, 5, 1).timestamp()
+        if os.path.exists(file_path) and os.path.getmtime(file_path) >= season_end:
+            return float('inf')
+        return 7 * 86400.0
     
     def _wait(self, seconds: float = 1.0) -> None:
         """
@@ -95,19 +814,95 @@ class ESPNStatsScraperBase:
         time.sleep(seconds)
 
 
+class ESPNSeleniumScraperBase(ESPNStatsScraperBase):
+    """Base class for ESPN scrapers that render pages with a headless Chrome."""
+    
+    def __init__(self, base_url: str, output_dir: str = "data", session: Optional[requests.Session] = None):
+        """
+        Initialize the scraper.
+        
+        Chrome is only started when the first page is scraped, so creating the
+        scraper is cheap; use it as a context manager or call close() to quit it.
+        
+        Args:
+            base_url: Base URL for the ESPN stats page
+            output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
+        """
+        super().__init__(base_url=base_url, output_dir=output_dir, session=session)
+        # Import Selenium here so it's only required when this class is used
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        self.driver = None
+        self.wait = None
+        self.By = By
+        self.EC = EC
+    
+    def _ensure_driver(self) -> Any:
+        """
+        Start the headless Chrome driver if it is not running yet.
+        
+        Returns:
+            Selenium WebDriver to scrape with
+        """
+        if self.driver is not None:
+            return self.driver
+        
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        # Set up Selenium
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
+        # Return from driver.get once the DOM is ready instead of waiting for every asset
+        chrome_options.page_load_strategy = "eager"
+        
+        self.driver = webdriver.Chrome(
+            service=Service(chrome_driver_path()),
+            options=chrome_options
+        )
+        self.wait = WebDriverWait(self.driver, 10)
+        return self.driver
+    
+    def close(self) -> None:
+        """Quit the Selenium driver if it was started and close the HTTP session."""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logger.error("Error closing Selenium driver: %s", e)
+            self.driver = None
+            self.wait = None
+        super().close()
+
+
 class ESPNMensBasketballTeamStatsScraperMCB(ESPNStatsScraperBase):
     """Scraper for ESPN men's college basketball team stats."""
     
-    def __init__(self, output_dir: str = "data"):
+    # Prefix of the per-year files the scraped stats are saved under
+    output_name = "mens_basketball_team_stats"
+    
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/stats/team",
-            output_dir=output_dir
+            output_dir=output_dir,
+            session=session
         )
     
     def scrape_team_stats(self, year: Optional[int] = None) -> pd.DataFrame:
@@ -120,72 +915,131 @@ class ESPNMensBasketballTeamStatsScraperMCB(ESPNStatsScraperBase):
         Returns:
             DataFrame containing the team statistics
         """
-        url = self.base_url
-        if year is not None:
-            # The URL format for specific seasons (note: this might change)
-            url = f"{self.base_url}/_/season/{year}/seasontype/2"
-        
-        logger.info(f"Scraping team stats for {'current season' if year is None else year}")
+        logger.info("Scraping team stats for %s", 'current season' if year is None else year)
         
         # Get the page content
-        soup = self._get_page(url)
-        if not soup:
+        html = self._fetch(self._year_url(year))
+        if html is None:
             logger.error("Failed to retrieve page content")
             return pd.DataFrame()
         
-        # Find the stats tables - ESPN typically has two tables: one for teams and one for stats
-        tables = soup.select("div.Wrapper > div.ResponsiveTable")
-        if len(tables) < 2:
-            logger.error("Could not find stats tables on the page")
-            return pd.DataFrame()
+        return self._parse_team_stats(html)
+    
+    def _year_url(self, year: Optional[int] = None) -> str:
+        """
+        Build the team stats URL for a specific year.
         
-        # Team names table
-        team_table = tables[0]
-        # Stats table
-        stats_table = tables[1]
-        
-        # Extract team names
-        teams = []
-        team_rows = team_table.select("tbody > tr")
-        for row in team_rows:
-            team_cell = row.select_one("td:nth-of-type(1)")
-            if team_cell:
-                teams.append(team_cell.get_text(strip=True))
-        
-        # Extract stats
-        stats_rows = stats_table.select("tbody > tr")
-        headers = [th.get_text(strip=True) for th in stats_table.select("thead > tr > th")]
-        
-        stats_data = []
-        for row in stats_rows:
-            row_data = [td.get_text(strip=True) for td in row.select("td")]
-            stats_data.append(row_data)
-        
-        # Create stats DataFrame
-        if not stats_data or not headers:
-            logger.error("Failed to extract stats data")
-            return pd.DataFrame()
+        Args:
+            year: Year to build the URL for. If None, uses the current season.
+            
+        Returns:
+            URL of the team stats page
+        """
+        if year is None:
+            return self.base_url
+        # The URL format for specific seasons (note: this might change)
+        return f"{self.base_url}/_/season/{year}/seasontype/2"
+    
+    def _parse_team_stats(self, html: Union[str, bytes]) -> pd.DataFrame:
+        """
+        Parse raw HTML and extract team statistics from it.
         
-        stats_df = pd.DataFrame(stats_data, columns=headers)
+        Args:
+            html: Raw HTML content of the team stats page
+            
+        Returns:
+            DataFrame containing the team statistics
+        """
+        return _team_stats_from_tree(self._parse_tree(html))
+    
+    async def scrape_multiple_years_async(self, start_year: int, end_year: int, max_concurrency: int = 4,
+                                          force: bool = False) -> Dict[int, pd.DataFrame]:
+        """
+        Scrape team statistics for multiple years concurrently.
         
-        # Create teams DataFrame
-        teams_df = pd.DataFrame({"Team": teams})
+        Pages are fetched with aiohttp, bounded by a semaphore and throttled by the
+        host's shared token bucket to stay polite, and parsed in an executor so
+        parsing overlaps with in-flight requests. A progress bar shows the downloads.
         
-        # Combine teams and stats
-        if len(teams_df) == len(stats_df):
-            result_df = pd.concat([teams_df, stats_df], axis=1)
-            return result_df
-        else:
-            logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
-            return pd.DataFrame()
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            max_concurrency: Maximum number of concurrent requests
+            force: Scrape years again even if usable saved data exists
+            
+        Returns:
+            Dictionary mapping years to DataFrames containing team statistics
+        """
+        import aiohttp
+        from tqdm.asyncio import tqdm_asyncio
+        
+        results = {}
+        years = []
+        for year in range(start_year, end_year + 1):
+            filename = self._output_filename(f"{self.output_name}_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+            else:
+                years.append(year)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def scrape_year(session: aiohttp.ClientSession, year: int) -> pd.DataFrame:
+            logger.info("Scraping data for %s", year)
+            html = await self._afetch(session, self._year_url(year), semaphore)
+            if html is None:
+                return pd.DataFrame()
+            return await loop.run_in_executor(None, self._parse_team_stats, html)
+        
+        async with self._client_session(max_concurrency) as session:
+            # Show the downloads' progress while keeping the results in year order
+            frames = await tqdm_asyncio.gather(*(scrape_year(session, year) for year in years),
+                                               desc="Team stats", unit="year")
+        
+        for year, df in zip(years, frames):
+            if not df.empty:
+                results[year] = df
+                filename = self._output_filename(f"{self.output_name}_{year}")
+                self._save(df, filename)
+            else:
+                logger.warning("No data retrieved for %s", year)
+        
+        return dict(sorted(results.items()))
     
-    def scrape_multiple_years(self, start_year: int, end_year: int) -> Dict[int, pd.DataFrame]:
+    def scrape_multiple_years(self, start_year: int, end_year: int, force: bool = False) -> Dict[int, pd.DataFrame]:
         """
         Scrape team statistics for multiple years.
         
+        Uses concurrent aiohttp requests when aiohttp is installed, otherwise
+        falls back to fetching one year at a time.
+        
+        Args:
+            start_year: First year to scrape data for
+            end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
+            
+        Returns:
+            Dictionary mapping years to DataFrames containing team statistics
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            logger.warning("aiohttp is not installed, scraping years sequentially")
+            return self._scrape_multiple_years_sequential(start_year, end_year, force=force)
+        
+        return asyncio.run(self.scrape_multiple_years_async(start_year, end_year, force=force))
+    
+    def _scrape_multiple_years_sequential(self, start_year: int, end_year: int,
+                                          force: bool = False) -> Dict[int, pd.DataFrame]:
+        """
+        Scrape team statistics for multiple years, one year at a time.
+        
         Args:
             start_year: First year to scrape data for
             end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
             
         Returns:
             Dictionary mapping years to DataFrames containing team statistics
@@ -193,68 +1047,89 @@ class ESPNMensBasketballTeamStatsScraperMCB(ESPNStatsScraperBase):
         results = {}
         
         for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping data for {year}")
+            filename = self._output_filename(f"{self.output_name}_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+                continue
+            
+            logger.info("Scraping data for %s", year)
             df = self.scrape_team_stats(year)
             
             if not df.empty:
                 results[year] = df
-                filename = f"mens_basketball_team_stats_{year}.csv"
-                self._save_to_csv(df, filename)
+                self._save(df, filename)
             else:
-                logger.warning(f"No data retrieved for {year}")
-            
-            # Wait between requests to avoid overloading the server
-            self._wait(2.0)
+                logger.warning("No data retrieved for %s", year)
         
         return results
 
 
-class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
+class ESPNMensBasketballTeamStatsScraperAPI(ESPNMensBasketballTeamStatsScraperMCB):
+    """Scraper for ESPN men's college basketball team stats using ESPN's JSON API."""
+    
+    # Endpoint the stats page loads its tables from; limit covers every Division I team
+    API_URL = "https://site.web.api.espn.com/apis/common/v3/sports/basketball/mens-college-basketball/statistics/byteam"
+    
+    # The API's stat labels differ from the HTML table headers, so keep its files
+    # apart from the HTML scraper's instead of mixing two schemas under one name
+    output_name = "mens_basketball_team_stats_api"
+    
+    def _year_url(self, year: Optional[int] = None) -> str:
+        """
+        Build the team statistics API URL for a specific year.
+        
+        Args:
+            year: Year to build the URL for. If None, uses the current season.
+            
+        Returns:
+            URL of the team statistics API endpoint
+        """
+        if year is None:
+            return f"{self.API_URL}?seasontype=2&limit=400"
+        return f"{self.API_URL}?season={year}&seasontype=2&limit=400"
+    
+    def _parse_team_stats(self, html: Union[str, bytes]) -> pd.DataFrame:
+        """
+        Extract team statistics from a statistics API response.
+        
+        Args:
+            html: Raw JSON content of the API response
+            
+        Returns:
+            DataFrame containing the team statistics
+        """
+        try:
+            data = json_loads(html)
+        except ValueError as e:
+            logger.error("Failed to decode team stats API response: %s", e)
+            return pd.DataFrame()
+        
+        result_df = _team_stats_from_json(data)
+        if result_df.empty:
+            logger.error("Failed to extract stats data")
+        return result_df
+
+
+class ESPNMensBasketballTeamStatsScraperSelenium(ESPNSeleniumScraperBase):
     """Scraper for ESPN men's college basketball team stats using Selenium for JavaScript-rendered content."""
     
-    def __init__(self, output_dir: str = "data"):
+    # Prefix of the per-year files the scraped stats are saved under
+    output_name = "mens_basketball_team_stats"
+    
+    def __init__(self, output_dir: str = "data", session: Optional[requests.Session] = None):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save the scraped data
+            session: Shared requests session to fetch with, or None to create one
         """
         super().__init__(
             base_url="https://www.espn.com/mens-college-basketball/stats/team",
-            output_dir=output_dir
-        )
-        # Import Selenium here so it's only required when this class is used
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        # Set up Selenium
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-        
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
+            output_dir=output_dir,
+            session=session
         )
-        self.wait = WebDriverWait(self.driver, 10)
-        self.By = By
-        self.EC = EC
-    
-    def __del__(self):
-        """Clean up Selenium driver when the object is destroyed."""
-        try:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
-        except Exception as e:
-            logger.error(f"Error closing Selenium driver: {e}")
     
     def _get_selector_dropdown_options(self) -> Dict[str, str]:
         """
@@ -281,9 +1156,29 @@ class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
             
             return options
         except Exception as e:
-            logger.error(f"Error getting season options: {e}")
+            logger.error("Error getting season options: %s", e)
             return {}
     
+    def _extract_table_js(self, table: Any) -> Tuple[List[str], List[List[str]]]:
+        """
+        Read the header and body cell texts of a table in a single driver call.
+        
+        Args:
+            table: WebElement of the 'div.ResponsiveTable' container
+            
+        Returns:
+            Tuple of (header texts, list of row cell texts)
+        """
+        headers, rows = self.driver.execute_script(
+            "const texts = cells => Array.from(cells, cell => cell.innerText.trim());"
+            "return ["
+            "  texts(arguments[0].querySelectorAll('thead > tr > th')),"
+            "  Array.from(arguments[0].querySelectorAll('tbody > tr'), row => texts(row.querySelectorAll('td')))"
+            "];",
+            table
+        )
+        return headers, rows
+    
     def scrape_team_stats(self, year: Optional[int] = None) -> pd.DataFrame:
         """
         Scrape team statistics for a specific year using Selenium.
@@ -299,10 +1194,11 @@ class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
             # The URL format for specific seasons
             url = f"{self.base_url}/_/season/{year}/seasontype/2"
         
-        logger.info(f"Scraping team stats for {'current season' if year is None else year}")
+        logger.info("Scraping team stats for %s", 'current season' if year is None else year)
         
         try:
             # Navigate to the page
+            self._ensure_driver()
             self.driver.get(url)
             
             # Wait for the tables to load
@@ -318,37 +1214,38 @@ class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
                     all_stats = []
                     
                     while True:
-                        # Extract team names from current page
+                        # Look up each table once per page; the elements go stale when the page changes
                         team_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(1)")
-                        team_rows = team_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
+                        stats_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(2)")
                         
-                        for row in team_rows:
-                            team_cell = row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1)")
-                            all_teams.append(team_cell.text.strip())
+                        # Extract team names and stats from current page, one driver call per table
+                        _, team_rows = self._extract_table_js(team_table)
+                        all_teams.extend(row[0] for row in team_rows if row)
                         
-                        # Extract stats from current page
-                        stats_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(2)")
-                        stats_rows = stats_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
+                        page_headers, stats_rows = self._extract_table_js(stats_table)
                         
                         # Get headers if this is the first page
                         if not all_stats:
-                            headers = [th.text.strip() for th in stats_table.find_elements(self.By.CSS_SELECTOR, "thead > tr > th")]
+                            headers = page_headers
                         
-                        for row in stats_rows:
-                            row_data = [td.text.strip() for td in row.find_elements(self.By.CSS_SELECTOR, "td")]
-                            all_stats.append(row_data)
+                        all_stats.extend(stats_rows)
                         
                         # Try to go to the next page
                         next_button = pagination.find_element(self.By.CSS_SELECTOR, "button[data-track='click:next']")
-                        if next_button and next_button.is_enabled():
+                        if next_button and next_button.is_enabled() and stats_rows:
+                            old_first_row = stats_table.find_element(self.By.CSS_SELECTOR, "tbody > tr")
                             next_button.click()
-                            # Wait for the table to update
-                            time.sleep(1)
+                            # Wait until the rows read above are replaced instead of sleeping a fixed time
+                            self.wait.until(self.EC.staleness_of(old_first_row))
+                            self.wait.until(self.EC.presence_of_element_located(
+                                (self.By.CSS_SELECTOR, "div.ResponsiveTable tbody tr")
+                            ))
+                            pagination = self.driver.find_element(self.By.CSS_SELECTOR, "div.Pagination__Controls")
                         else:
                             break
                     
-                    # Create DataFrame
-                    stats_df = pd.DataFrame(all_stats, columns=headers)
+                    # Create DataFrame, converting the stat columns to numeric dtypes column by column
+                    stats_df = coerce_numeric_columns(pd.DataFrame(all_stats, columns=headers))
                     teams_df = pd.DataFrame({"Team": all_teams})
                     
                     # Combine teams and stats
@@ -356,50 +1253,28 @@ class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
                         result_df = pd.concat([teams_df, stats_df], axis=1)
                         return result_df
                     else:
-                        logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
+                        logger.error("Team count (%s) does not match stats count (%s)", len(teams_df), len(stats_df))
                         return pd.DataFrame()
             except Exception as e:
                 # If pagination element is not found, just extract the data from the single page
-                logger.info(f"No pagination found or error navigating pages: {e}")
+                logger.info("No pagination found or error navigating pages: %s", e)
                 
-                # Extract data using Selenium from the current page
-                # Extract team names
-                team_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(1)")
-                team_rows = team_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                teams = [row.find_element(self.By.CSS_SELECTOR, "td:nth-of-type(1)").text.strip() for row in team_rows]
-                
-                # Extract stats
-                stats_table = self.driver.find_element(self.By.CSS_SELECTOR, "div.ResponsiveTable:nth-of-type(2)")
-                headers = [th.text.strip() for th in stats_table.find_elements(self.By.CSS_SELECTOR, "thead > tr > th")]
-                stats_rows = stats_table.find_elements(self.By.CSS_SELECTOR, "tbody > tr")
-                stats_data = []
-                for row in stats_rows:
-                    row_data = [td.text.strip() for td in row.find_elements(self.By.CSS_SELECTOR, "td")]
-                    stats_data.append(row_data)
-                
-                # Create DataFrames
-                stats_df = pd.DataFrame(stats_data, columns=headers)
-                teams_df = pd.DataFrame({"Team": teams})
-                
-                # Combine teams and stats
-                if len(teams_df) == len(stats_df):
-                    result_df = pd.concat([teams_df, stats_df], axis=1)
-                    return result_df
-                else:
-                    logger.error(f"Team count ({len(teams_df)}) does not match stats count ({len(stats_df)})")
-                    return pd.DataFrame()
+                # The page is rendered, so fetch its source in one driver call and
+                # extract the tables in-process with lxml, like the requests scraper
+                return _team_stats_from_tree(self._parse_tree(self.driver.page_source))
         
         except Exception as e:
-            logger.error(f"Error scraping team stats: {e}")
+            logger.error("Error scraping team stats: %s", e)
             return pd.DataFrame()
     
-    def scrape_multiple_years(self, start_year: int, end_year: int) -> Dict[int, pd.DataFrame]:
+    def scrape_multiple_years(self, start_year: int, end_year: int, force: bool = False) -> Dict[int, pd.DataFrame]:
         """
         Scrape team statistics for multiple years.
         
         Args:
             start_year: First year to scrape data for
             end_year: Last year to scrape data for
+            force: Scrape years again even if usable saved data exists
             
         Returns:
             Dictionary mapping years to DataFrames containing team statistics
@@ -407,15 +1282,20 @@ class ESPNMensBasketballTeamStatsScraperSelenium(ESPNStatsScraperBase):
         results = {}
         
         for year in range(start_year, end_year + 1):
-            logger.info(f"Scraping data for {year}")
+            filename = self._output_filename(f"{self.output_name}_{year}")
+            saved_df = None if force else self._load_saved(filename, self._saved_max_age(year, filename))
+            if saved_df is not None:
+                results[year] = saved_df
+                continue
+            
+            logger.info("Scraping data for %s", year)
             df = self.scrape_team_stats(year)
             
             if not df.empty:
                 results[year] = df
-                filename = f"mens_basketball_team_stats_{year}.csv"
-                self._save_to_csv(df, filename)
+                self._save(df, filename)
             else:
-                logger.warning(f"No data retrieved for {year}")
+                logger.warning("No data retrieved for %s", year)
             
             # Wait between requests to avoid overloading the server
             self._wait(2.0)
@@ -436,17 +1316,36 @@ def main():
                         help='Directory to save the scraped data')
     parser.add_argument('--use-selenium', action='store_true',
                         help='Use Selenium for scraping (required for JavaScript-rendered content)')
+    parser.add_argument('--use-api', action='store_true',
+                        help='Read ESPN\'s JSON statistics API instead of the HTML pages; its '
+                             'columns use the API\'s stat labels, not the HTML table headers')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Clear the HTML cache and fetch all pages again')
+    parser.add_argument('--csv', action='store_true',
+                        help='Save the scraped data as CSV instead of parquet')
+    parser.add_argument('--force', action='store_true',
+                        help='Scrape years again even if usable saved data exists')
     
     args = parser.parse_args()
     
     if args.use_selenium:
         logger.info("Using Selenium scraper")
         scraper = ESPNMensBasketballTeamStatsScraperSelenium(output_dir=args.output_dir)
+    elif args.use_api:
+        logger.info("Using ESPN JSON API scraper")
+        scraper = ESPNMensBasketballTeamStatsScraperAPI(output_dir=args.output_dir)
     else:
-        logger.info("Using requests/BeautifulSoup scraper")
+        logger.info("Using requests/lxml scraper")
         scraper = ESPNMensBasketballTeamStatsScraperMCB(output_dir=args.output_dir)
     
-    scraper.scrape_multiple_years(args.start_year, args.end_year)
+    if args.csv:
+        scraper.output_format = 'csv'
+    
+    if args.refresh:
+        scraper.clear_cache()
+    
+    with scraper:
+        scraper.scrape_multiple_years(args.start_year, args.end_year, force=args.force)
 
 
 if __name__ == "__main__":
@@ -32,26 +32,21 @@ def weight_by_recency(data_by_year: Dict[int, pd.DataFrame],
     years = sorted(data_by_year.keys())
     
     # Identify years to emphasize
-    recent_years = years[-emphasis_years:] if len(years) >= emphasis_years else years
-    
-    weighted_dfs = []
-    for year, df in data_by_year.items():
-        if not df.empty:
-            # Add year as a column
-            year_df = df.copy()
-            year_df['year'] = year
-            
-            # Apply weight based on recency
-            weight = emphasis_weight if year in recent_years else base_weight
-            year_df['weight'] = weight
-            
-            weighted_dfs.append(year_df)
-    
-    if not weighted_dfs:
+    recent_years = frozenset(years[-emphasis_years:] if len(years) >= emphasis_years else years)
+    
+    frames = {year: df for year, df in data_by_year.items() if not df.empty}
+    
+    if not frames:
         raise ValueError("No valid data frames to combine")
     
-    # Combine all years into a single DataFrame
-    return pd.concat(weighted_dfs, ignore_index=True)
+    # Combine all years into a single DataFrame without copying each year first
+    combined = pd.concat(frames.values(), ignore_index=True)
+    
+    # Add year as a column and apply weight based on recency in one vectorized pass
+    combined['year'] = np.repeat(list(frames.keys()), [len(df) for df in frames.values()])
+    combined['weight'] = np.where(combined['year'].isin(recent_years), emphasis_weight, base_weight)
+    
+    return combined
 
 
 def create_team_features(team_stats_by_year: Dict[int, pd.DataFrame],
@@ -73,9 +68,10 @@ def create_team_features(team_stats_by_year: Dict[int, pd.DataFrame],
     
     # Add rankings if available
     if rankings_by_year:
-        weighted_rankings = weight_by_recency(rankings_by_year, emphasis_years)
         # Merge rankings with team stats (implementation depends on actual data structure)
-        # This is a placeholder - actual implementation will depend on data structure
+        # This is a placeholder - actual implementation will depend on data structure.
+        # Weight the rankings with weight_by_recency here once they are merged; until
+        # then the weighted frame would be built only to be thrown away.
         pass
     
     # Additional feature engineering would go here
@@ -124,6 +120,7 @@ def prepare_training_data(team_stats_by_year: Dict[int, pd.DataFrame],
         Tuple of (X, y) where X is feature DataFrame and y is target Series
     """
     # Filter to only include target years
+    target_years = frozenset(target_years)
     filtered_stats = {year: df for year, df in team_stats_by_year.items() if year in target_years}
     filtered_rankings = {year: df for year, df in rankings_by_year.items() if year in target_years}
     filtered_games = {year: df for year, df in games_by_year.items() if year in target_years}
@@ -10,6 +10,8 @@ import argparse
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 import pandas as pd
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 import time
 import sys
@@ -21,6 +23,7 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 from espn_stats_scraper import (
     ESPNMensBasketballTeamStatsScraperMCB, 
     ESPNMensBasketballTeamStatsScraperSelenium, 
+    create_session,
     logger
 )
 from espn_opponent_stats_scraper import (
@@ -45,6 +48,178 @@ def setup_logging():
     )
 
 
+def _save_year_file(df: pd.DataFrame, output_dir: str, year: int, name: str, file_format: str) -> None:
+    """
+    Save one year's data into its per-year directory.
+    
+    Args:
+        df: DataFrame to save
+        output_dir: Directory to save the scraped data
+        year: Year of the data
+        name: Name of the data file without extension (e.g., 'team_stats')
+        file_format: 'parquet' or 'csv' (gzipped)
+    """
+    if file_format == "parquet":
+        year_file = os.path.join(output_dir, str(year), f"{name}.parquet")
+        try:
+            df.to_parquet(year_file, index=False, compression="zstd")
+            logger.info("Saved %s for %s to %s", name.replace('_', ' '), year, year_file)
+            return
+        except ImportError:
+            logger.warning("No Parquet engine installed, saving CSV instead; install pyarrow for faster writes")
+        except (TypeError, ValueError) as e:
+            # Arrow cannot store columns of mixed types
+            logger.warning("Could not save %s as Parquet (%s), saving CSV instead", year_file, e)
+    
+    # Fastest gzip level: most of the size win for a fraction of the default level's time,
+    # and a fixed mtime keeps re-scrapes of unchanged data byte-identical
+    year_file = os.path.join(output_dir, str(year), f"{name}.csv.gz")
+    df.to_csv(year_file, index=False, compression={"method": "gzip", "compresslevel": 1, "mtime": 1})
+    logger.info("Saved %s for %s to %s", name.replace('_', ' '), year, year_file)
+
+
+def _save_year_files(frames: Dict[int, pd.DataFrame], output_dir: str, name: str, file_format: str,
+                     max_workers: int = 4) -> None:
+    """
+    Save several years' data into their per-year directories concurrently.
+    
+    pyarrow and zlib release the GIL while encoding and writing, so the files
+    are written in parallel instead of one after another.
+    
+    Args:
+        frames: Dictionary mapping years to the DataFrames to save
+        output_dir: Directory to save the scraped data
+        name: Name of the data files without extension (e.g., 'team_stats')
+        file_format: 'parquet' or 'csv' (gzipped)
+        max_workers: Maximum number of files written at the same time
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_save_year_file, df, output_dir, year, name, file_format)
+            for year, df in frames.items()
+        ]
+        # Re-raise the first error of any write
+        for future in futures:
+            future.result()
+
+
+def _scrape_team_stats_stage(start_year: int, end_year: int, output_dir: str,
+                             use_selenium: bool, file_format: str = "parquet",
+                             session: Optional[requests.Session] = None,
+                             use_cache: bool = True) -> Dict[int, pd.DataFrame]:
+    """
+    Scrape team stats and save them into the per-year directories.
+    
+    Args:
+        start_year: First year to scrape data for
+        end_year: Last year to scrape data for
+        output_dir: Directory to save the scraped data
+        use_selenium: Whether to use Selenium for scraping
+        file_format: Format of the per-year files, 'parquet' or 'csv'
+        session: Shared requests session for the scraper, or None to let it create one
+        use_cache: Whether the scraper may reuse its HTML cache and previously saved data
+        
+    Returns:
+        Dictionary mapping years to team stats DataFrames
+    """
+    logger.info("Scraping team stats...")
+    
+    if use_selenium:
+        team_stats_scraper = ESPNMensBasketballTeamStatsScraperSelenium(output_dir=output_dir, session=session)
+    else:
+        team_stats_scraper = ESPNMensBasketballTeamStatsScraperMCB(output_dir=output_dir, session=session)
+    team_stats_scraper.use_cache = use_cache
+    
+    # Quit Chrome or release pooled connections as soon as this stage is done
+    with team_stats_scraper:
+        team_stats_results = team_stats_scraper.scrape_multiple_years(start_year, end_year,
+                                                                      force=not use_cache)
+    
+    # Organize files by year
+    _save_year_files(team_stats_results, output_dir, "team_stats", file_format)
+    
+    return team_stats_results
+
+
+def _scrape_opponent_stats_stage(start_year: int, end_year: int, output_dir: str,
+                                 use_selenium: bool, file_format: str = "parquet",
+                                 session: Optional[requests.Session] = None,
+                                 use_cache: bool = True) -> Dict[int, pd.DataFrame]:
+    """
+    Scrape opponent stats and save them into the per-year directories.
+    
+    Args:
+        start_year: First year to scrape data for
+        end_year: Last year to scrape data for
+        output_dir: Directory to save the scraped data
+        use_selenium: Whether to use Selenium for scraping
+        file_format: Format of the per-year files, 'parquet' or 'csv'
+        session: Shared requests session for the scraper, or None to let it create one
+        use_cache: Whether the scraper may reuse its HTML cache and previously saved data
+        
+    Returns:
+        Dictionary mapping years to opponent stats DataFrames
+    """
+    logger.info("Scraping opponent stats...")
+    
+    if use_selenium:
+        opponent_stats_scraper = ESPNMensBasketballOpponentStatsScraperSelenium(output_dir=output_dir, session=session)
+    else:
+        opponent_stats_scraper = ESPNMensBasketballOpponentStatsScraperMCB(output_dir=output_dir, session=session)
+    opponent_stats_scraper.use_cache = use_cache
+    
+    # Quit Chrome or release pooled connections as soon as this stage is done
+    with opponent_stats_scraper:
+        opponent_stats_results = opponent_stats_scraper.scrape_multiple_years(start_year, end_year,
+                                                                              force=not use_cache)
+    
+    # Organize files by year
+    _save_year_files(opponent_stats_results, output_dir, "opponent_stats", file_format)
+    
+    return opponent_stats_results
+
+
+def _scrape_rankings_stage(start_year: int, end_year: int, output_dir: str,
+                           use_selenium: bool, file_format: str = "parquet",
+                           session: Optional[requests.Session] = None,
+                           use_cache: bool = True) -> Dict[int, Dict[str, pd.DataFrame]]:
+    """
+    Scrape rankings and save them into the per-year directories.
+    
+    Args:
+        start_year: First year to scrape data for
+        end_year: Last year to scrape data for
+        output_dir: Directory to save the scraped data
+        use_selenium: Whether to use Selenium for scraping
+        file_format: Format of the per-year files, 'parquet' or 'csv'
+        session: Shared requests session for the scraper, or None to let it create one
+        use_cache: Whether the scraper may answer fetches from its HTML cache
+        
+    Returns:
+        Dictionary mapping years to dictionaries of poll names to DataFrames
+    """
+    logger.info("Scraping rankings...")
+    
+    if use_selenium:
+        rankings_scraper = ESPNMensBasketballRankingsScraperSelenium(output_dir=output_dir, session=session)
+    else:
+        rankings_scraper = ESPNMensBasketballRankingsScraperMCB(output_dir=output_dir, session=session)
+    rankings_scraper.use_cache = use_cache
+    
+    # Reuse the scraper's pooled session or browser for every year, then release it
+    with rankings_scraper:
+        rankings_results = rankings_scraper.scrape_multiple_years(start_year, end_year)
+    
+    # Organize files by year, combining all polls of a year into a single DataFrame
+    combined_dfs = {
+        year: pd.concat(poll_dfs.values(), ignore_index=True)
+        for year, poll_dfs in rankings_results.items() if poll_dfs
+    }
+    _save_year_files(combined_dfs, output_dir, "rankings", file_format)
+    
+    return rankings_results
+
+
 def scrape_all_data(
     start_year: int,
     end_year: int, 
@@ -53,11 +228,20 @@ def scrape_all_data(
     scrape_team_stats: bool = True,
     scrape_opponent_stats: bool = True,
     scrape_rankings: bool = True,
-    wait_time: float = 2.0
+    wait_time: float = 2.0,
+    parallel: bool = True,
+    file_format: str = "parquet",
+    use_cache: bool = True
 ) -> Dict[str, Dict[int, pd.DataFrame]]:
     """
     Scrape all types of data for the specified years.
     
+    The scraper stages are network-bound and independent, so by default they run
+    concurrently in threads. Each scraper fetches its own years concurrently, so
+    several stages can have requests in flight at once, but every request (sync or
+    aiohttp) takes a token from the host's token bucket, which is shared by all
+    scrapers; the combined request rate to espn.com stays at the bucket's limit.
+    
     Args:
         start_year: First year to scrape data for
         end_year: Last year to scrape data for
@@ -66,7 +250,12 @@ def scrape_all_data(
         scrape_team_stats: Whether to scrape team stats
         scrape_opponent_stats: Whether to scrape opponent stats
         scrape_rankings: Whether to scrape rankings
-        wait_time: Time to wait between different scraper runs
+        wait_time: Time to wait between different scraper runs when not running in parallel
+        parallel: Whether to run the scraper stages concurrently
+        file_format: Format of the per-year files, 'parquet' (default) or 'csv'
+        use_cache: Whether pages may be served from the on-disk HTML cache and
+            previously saved stats reused. Pages cached within the last day make
+            reruns skip the network entirely.
         
     Returns:
         Dictionary mapping data types to dictionaries mapping years to DataFrames
@@ -75,74 +264,37 @@ def scrape_all_data(
     
     # Create data directory structure by year
     for year in range(start_year, end_year + 1):
-        year_dir = os.path.join(output_dir, str(year))
-        if not os.path.exists(year_dir):
-            os.makedirs(year_dir)
+        os.makedirs(os.path.join(output_dir, str(year)), exist_ok=True)
     
-    # Scrape team stats
+    stages = {}
     if scrape_team_stats:
-        logger.info("Scraping team stats...")
-        
-        if use_selenium:
-            team_stats_scraper = ESPNMensBasketballTeamStatsScraperSelenium(output_dir=output_dir)
-        else:
-            team_stats_scraper = ESPNMensBasketballTeamStatsScraperMCB(output_dir=output_dir)
-        
-        team_stats_results = team_stats_scraper.scrape_multiple_years(start_year, end_year)
-        results['team_stats'] = team_stats_results
-        
-        # Organize files by year
-        for year, df in team_stats_results.items():
-            year_file = os.path.join(output_dir, str(year), "team_stats.csv")
-            df.to_csv(year_file, index=False)
-            logger.info(f"Saved team stats for {year} to {year_file}")
-        
-        # Wait between different scrapers
-        if scrape_opponent_stats or scrape_rankings:
-            time.sleep(wait_time)
-    
-    # Scrape opponent stats
+        stages['team_stats'] = _scrape_team_stats_stage
     if scrape_opponent_stats:
-        logger.info("Scraping opponent stats...")
-        
-        if use_selenium:
-            opponent_stats_scraper = ESPNMensBasketballOpponentStatsScraperSelenium(output_dir=output_dir)
-        else:
-            opponent_stats_scraper = ESPNMensBasketballOpponentStatsScraperMCB(output_dir=output_dir)
-        
-        opponent_stats_results = opponent_stats_scraper.scrape_multiple_years(start_year, end_year)
-        results['opponent_stats'] = opponent_stats_results
-        
-        # Organize files by year
-        for year, df in opponent_stats_results.items():
-            year_file = os.path.join(output_dir, str(year), "opponent_stats.csv")
-            df.to_csv(year_file, index=False)
-            logger.info(f"Saved opponent stats for {year} to {year_file}")
-        
-        # Wait between different scrapers
-        if scrape_rankings:
-            time.sleep(wait_time)
-    
-    # Scrape rankings
+        stages['opponent_stats'] = _scrape_opponent_stats_stage
     if scrape_rankings:
-        logger.info("Scraping rankings...")
-        
-        if use_selenium:
-            rankings_scraper = ESPNMensBasketballRankingsScraperSelenium(output_dir=output_dir)
+        stages['rankings'] = _scrape_rankings_stage
+    
+    # One pooled keep-alive session for all scrapers, so every stage reuses the
+    # connections to ESPN instead of opening its own; requests sessions are thread-safe
+    with create_session(pool_connections=16, pool_maxsize=64) as session:
+        if parallel and len(stages) > 1:
+            with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+                futures = {
+                    executor.submit(stage, start_year, end_year, output_dir, use_selenium, file_format,
+                                    session, use_cache): name
+                    for name, stage in stages.items()
+                }
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Scraper stages"):
+                    results[futures[future]] = future.result()
+            # Keep the results in stage order regardless of which stage finished first
+            results = {name: results[name] for name in stages}
         else:
-            rankings_scraper = ESPNMensBasketballRankingsScraperMCB(output_dir=output_dir)
-        
-        rankings_results = rankings_scraper.scrape_multiple_years(start_year, end_year)
-        results['rankings'] = rankings_results
-        
-        # Organize files by year
-        for year, poll_dfs in rankings_results.items():
-            # Combine all polls into a single DataFrame
-            if poll_dfs:
-                combined_df = pd.concat(poll_dfs.values())
-                year_file = os.path.join(output_dir, str(year), "rankings.csv")
-                combined_df.to_csv(year_file, index=False)
-                logger.info(f"Saved rankings for {year} to {year_file}")
+            for index, (name, stage) in enumerate(stages.items()):
+                # Wait between different scrapers
+                if index > 0:
+                    time.sleep(wait_time)
+                results[name] = stage(start_year, end_year, output_dir, use_selenium, file_format,
+                                      session, use_cache)
     
     logger.info("All data scraping completed!")
     return results
@@ -166,7 +318,13 @@ def main():
     parser.add_argument('--no-rankings', action='store_true',
                         help='Skip rankings scraping')
     parser.add_argument('--wait-time', type=float, default=2.0,
-                        help='Wait time between different scraper runs in seconds')
+                        help='Wait time between different scraper runs in seconds (with --sequential)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Run the scrapers one after another instead of concurrently')
+    parser.add_argument('--file-format', choices=['parquet', 'csv'], default='parquet',
+                        help='Format of the per-year data files')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Fetch every page again instead of using the cached HTML pages or saved stats')
     
     args = parser.parse_args()
     
@@ -182,7 +340,10 @@ def main():
         scrape_team_stats=not args.no_team_stats,
         scrape_opponent_stats=not args.no_opponent_stats,
         scrape_rankings=not args.no_rankings,
-        wait_time=args.wait_time
+        wait_time=args.wait_time,
+        parallel=not args.sequential,
+        file_format=args.file_format,
+        use_cache=not args.no_cache
     )
 
 
@@ -4,22 +4,40 @@ Model factory for March Madness prediction models.
 This module provides a factory pattern for creating different types of models,
 from simple baseline models to more complex ML and deep learning models.
 """
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Callable, Type
 import pandas as pd
 import numpy as np
-import pickle
 import os
+import math
+import warnings
+import joblib
 
 # These would be replaced with actual model implementations
 from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.svm import SVC
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.svm import SVC, LinearSVC
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 
 
 class BaseModel:
     """Base class for all prediction models."""
     
+    # dtype the estimator is fitted and queried with; matching the estimator's
+    # internal dtype lets sklearn use the arrays without copying them again
+    feature_dtype = np.float64
+    
+    # Feature columns seen in training, in the order the estimator expects them
+    feature_columns: Optional[List[str]] = None
+    
+    # Estimator parameter counting the ensemble's trees or boosting iterations, for
+    # models whose estimator can grow with warm_start instead of being refitted
+    ensemble_size_param: Optional[str] = None
+    
+    # Number of trees or iterations incremental_fit adds by default
+    ensemble_step: Optional[int] = None
+    
     def __init__(self, model_params: Optional[Dict[str, Any]] = None):
         """
         Initialize the model.
@@ -41,6 +59,30 @@ class BaseModel:
         """
         raise NotImplementedError("Subclasses must implement train method")
     
+    def incremental_fit(self, X: pd.DataFrame, y: pd.Series, n_new: Optional[int] = None) -> None:
+        """
+        Grow the trained model with new data, e.g. the next season in walk-forward training.
+        
+        Ensemble models keep their fitted trees or boosting iterations and only fit
+        the added ones on X; other models, and untrained ones, are trained from scratch.
+        
+        Args:
+            X: Feature DataFrame with the training columns
+            y: Target Series
+            n_new: Number of trees or boosting iterations to add, by default as
+                many as the model was first trained with
+        """
+        if not self.is_trained or self.ensemble_size_param is None:
+            self.train(X, y)
+            return
+        
+        size = self.model.get_params()[self.ensemble_size_param]
+        if self.ensemble_step is None:
+            self.ensemble_step = size
+        new_size = size + (n_new or self.ensemble_step)
+        self.model.set_params(warm_start=True, **{self.ensemble_size_param: new_size})
+        self.model.fit(self._prepare_features(X), y)
+    
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """
         Make predictions using the trained model.
@@ -48,6 +90,25 @@ class BaseModel:
         Args:
             X: Feature DataFrame
             
+        Returns:
+            Array of predictions
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model must be trained before making predictions")
+        return self._predict_impl(self._prepare_features(X))
+    
+    def predict_fast(self, X: np.ndarray) -> np.ndarray:
+        """
+        Make predictions from an already prepared feature array.
+        
+        Skips the DataFrame column selection and conversion of predict, for hot
+        loops such as scoring many bracket permutations. Prepare the array once
+        with _prepare_features, or build it with the columns in feature_columns
+        order, C-contiguous and of feature_dtype, so sklearn does not copy it.
+        
+        Args:
+            X: Feature array prepared by _prepare_features
+            
         Returns:
             Array of predictions
         """
@@ -55,12 +116,36 @@ class BaseModel:
             raise RuntimeError("Model must be trained before making predictions")
         return self._predict_impl(X)
     
-    def _predict_impl(self, X: pd.DataFrame) -> np.ndarray:
+    def _prepare_features(self, X: Union[pd.DataFrame, np.ndarray],
+                          fit: bool = False) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Convert features to the contiguous array the estimator works on.
+        
+        Converting once here spares repeated predictions (e.g. bracket simulations)
+        the validation copy sklearn makes of DataFrames.
+        
+        Args:
+            X: Feature DataFrame or array
+            fit: Whether X is the training data, whose columns are remembered
+            
+        Returns:
+            C-contiguous feature_dtype array with the training columns in order, or
+            X unchanged for models saved before the columns were recorded
+        """
+        if not isinstance(X, pd.DataFrame):
+            return np.ascontiguousarray(X, dtype=self.feature_dtype)
+        if fit:
+            self.feature_columns = list(X.columns)
+        elif self.feature_columns is None:
+            return X
+        return np.ascontiguousarray(X[self.feature_columns].to_numpy(dtype=self.feature_dtype))
+    
+    def _predict_impl(self, X: np.ndarray) -> np.ndarray:
         """
         Implementation of prediction logic.
         
         Args:
-            X: Feature DataFrame
+            X: Feature array prepared by _prepare_features
             
         Returns:
             Array of predictions
@@ -83,43 +168,50 @@ class BaseModel:
         
         y_pred = self.predict(X)
         
-        # Calculate evaluation metrics
+        # Calculate evaluation metrics, counting the per-class matches once for
+        # precision, recall and F1 together
+        precision, recall, f1, _ = precision_recall_fscore_support(y, y_pred, average='weighted')
         metrics = {
             'accuracy': accuracy_score(y, y_pred),
-            'precision': precision_score(y, y_pred, average='weighted'),
-            'recall': recall_score(y, y_pred, average='weighted'),
-            'f1': f1_score(y, y_pred, average='weighted')
+            'precision': precision,
+            'recall': recall,
+            'f1': f1
         }
         
         return metrics
     
-    def save(self, filepath: str) -> None:
+    def save(self, filepath: str, compress: Union[int, bool] = 3) -> None:
         """
         Save the model to a file.
         
+        joblib writes the numpy arrays of the fitted estimator (e.g. the trees of a
+        forest) as raw buffers instead of pickling them element by element.
+        
         Args:
             filepath: Path to save the model to
+            compress: zlib compression level from 0 to 9, or 0/False for an
+                uncompressed file that can be memory-mapped on load
         """
         if not self.is_trained:
             raise RuntimeError("Cannot save untrained model")
         
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump(self, f)
+        joblib.dump(self, filepath, compress=compress, protocol=5)
     
     @classmethod
-    def load(cls, filepath: str) -> 'BaseModel':
+    def load(cls, filepath: str, mmap_mode: Optional[str] = None) -> 'BaseModel':
         """
         Load a model from a file.
         
         Args:
             filepath: Path to load the model from
+            mmap_mode: Memory-map the arrays of an uncompressed model file
+                (e.g. 'r' for read-only) instead of reading them into memory
             
         Returns:
             Loaded model
         """
-        with open(filepath, 'rb') as f:
-            model = pickle.load(f)
+        model = joblib.load(filepath, mmap_mode=mmap_mode)
         
         if not isinstance(model, cls):
             raise TypeError(f"Loaded model is not an instance of {cls.__name__}")
@@ -127,28 +219,63 @@ class BaseModel:
         return model
 
 
+# Model classes by the model type create_model is called with
+_MODEL_CLASSES: Dict[str, Type[BaseModel]] = {}
+
+
+def register_model(model_type: str) -> Callable[[Type[BaseModel]], Type[BaseModel]]:
+    """
+    Class decorator registering a model class with create_model.
+    
+    Args:
+        model_type: Type name to create the model by (e.g., 'random_forest')
+        
+    Returns:
+        Decorator that registers the class and returns it unchanged
+    """
+    def decorator(model_class: Type[BaseModel]) -> Type[BaseModel]:
+        _MODEL_CLASSES[model_type] = model_class
+        return model_class
+    return decorator
+
+
+@register_model('baseline')
 class BaselineModel(BaseModel):
     """Simple baseline model for March Madness predictions."""
     
+    # saga fits float32 features directly instead of upcasting them
+    feature_dtype = np.float32
+    
+    # Default LogisticRegression parameters, overridden by model_params; saga's
+    # stochastic passes scale better than lbfgs to many rows and wide features
+    default_params: Dict[str, Any] = {'solver': 'saga', 'max_iter': 200, 'tol': 1e-3}
+    
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the baseline model.
         
+        The features are standardized before the logistic regression, since saga
+        only converges quickly on features of similar scale (points per game next
+        to percentages would otherwise need many more passes).
+        
         Args:
             X: Feature DataFrame
             y: Target Series
         """
         # For baseline, we'll use logistic regression
-        self.model = LogisticRegression(**self.model_params)
-        self.model.fit(X, y)
+        self.model = make_pipeline(
+            StandardScaler(),
+            LogisticRegression(**{**self.default_params, **self.model_params})
+        )
+        self.model.fit(self._prepare_features(X, fit=True), y)
         self.is_trained = True
     
-    def _predict_impl(self, X: pd.DataFrame) -> np.ndarray:
+    def _predict_impl(self, X: np.ndarray) -> np.ndarray:
         """
         Make predictions using the baseline model.
         
         Args:
-            X: Feature DataFrame
+            X: Feature array
             
         Returns:
             Array of predictions
@@ -156,27 +283,41 @@ class BaselineModel(BaseModel):
         return self.model.predict(X)
 
 
+@register_model('random_forest')
 class RandomForestModel(BaseModel):
     """Random Forest model for March Madness predictions."""
     
+    # The trees compare float32 features, so skip the float64 round trip
+    feature_dtype = np.float32
+    
+    ensemble_size_param = 'n_estimators'
+    
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the Random Forest model.
         
+        With 'warm_start' in the model parameters, training a trained model again
+        adds trees fitted on the new data instead of rebuilding the forest.
+        
         Args:
             X: Feature DataFrame
             y: Target Series
         """
-        self.model = RandomForestClassifier(**self.model_params)
-        self.model.fit(X, y)
+        if self.model_params.get('warm_start') and self.is_trained:
+            self.incremental_fit(X, y)
+            return
+        
+        # Fit and query the trees on all cores unless the caller chose otherwise
+        self.model = RandomForestClassifier(**{'n_jobs': -1, **self.model_params})
+        self.model.fit(self._prepare_features(X, fit=True), y)
         self.is_trained = True
     
-    def _predict_impl(self, X: pd.DataFrame) -> np.ndarray:
+    def _predict_impl(self, X: np.ndarray) -> np.ndarray:
         """
         Make predictions using the Random Forest model.
         
         Args:
-            X: Feature DataFrame
+            X: Feature array
             
         Returns:
             Array of predictions
@@ -184,27 +325,80 @@ class RandomForestModel(BaseModel):
         return self.model.predict(X)
 
 
+@register_model('gradient_boosting')
 class GradientBoostingModel(BaseModel):
     """Gradient Boosting model for March Madness predictions."""
     
+    ensemble_size_param = 'max_iter'
+    
+    # GradientBoostingClassifier parameters that HistGradientBoostingClassifier names differently
+    renamed_params = {'n_estimators': 'max_iter'}
+    
+    def _hist_gradient_boosting_params(self, n_samples: int) -> Dict[str, Any]:
+        """
+        Translate GradientBoostingClassifier-style model parameters for the histogram model.
+        
+        Parameters with an equivalent are renamed or converted; the ones without
+        (e.g. 'subsample', 'min_samples_split') are dropped with a warning.
+        
+        Args:
+            n_samples: Number of training rows, to convert fractional leaf sizes
+            
+        Returns:
+            Parameters for HistGradientBoostingClassifier
+        """
+        supported = HistGradientBoostingClassifier().get_params()
+        params = {}
+        for name, value in self.model_params.items():
+            name = self.renamed_params.get(name, name)
+            if name == 'min_samples_leaf' and isinstance(value, float):
+                # A fraction of the training rows, which the histogram model only takes as a count
+                value = max(1, math.ceil(value * n_samples))
+            elif name == 'n_iter_no_change':
+                # The exact model only stops early when this is set
+                if value is None:
+                    continue
+                params.setdefault('early_stopping', True)
+            elif (name == 'max_features' and not (isinstance(value, float) and 0 < value <= 1)) or (
+                    name == 'loss' and value != 'log_loss'):
+                warnings.warn(f"Ignoring gradient boosting parameter {name}={value!r}, "
+                              f"which HistGradientBoostingClassifier does not support")
+                continue
+            if name not in supported:
+                warnings.warn(f"Ignoring gradient boosting parameter {name!r}, "
+                              f"which HistGradientBoostingClassifier does not have")
+                continue
+            params[name] = value
+        return params
+    
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the Gradient Boosting model.
         
+        Uses the histogram-based gradient boosting, which bins the features once
+        and builds the trees in parallel, instead of searching exact splits on a
+        single core. GradientBoostingClassifier-style parameters are translated by
+        _hist_gradient_boosting_params. With 'warm_start' in the model parameters,
+        training a trained model again adds boosting iterations fitted on the new data.
+        
         Args:
             X: Feature DataFrame
             y: Target Series
         """
-        self.model = GradientBoostingClassifier(**self.model_params)
-        self.model.fit(X, y)
+        if self.model_params.get('warm_start') and self.is_trained:
+            self.incremental_fit(X, y)
+            return
+        
+        self.model = HistGradientBoostingClassifier(**self._hist_gradient_boosting_params(len(X)))
+        self.model.fit(self._prepare_features(X, fit=True), y)
         self.is_trained = True
     
-    def _predict_impl(self, X: pd.DataFrame) -> np.ndarray:
+    def _predict_impl(self, X: np.ndarray) -> np.ndarray:
         """
         Make predictions using the Gradient Boosting model.
         
         Args:
-            X: Feature DataFrame
+            X: Feature array
             
         Returns:
             Array of predictions
@@ -212,27 +406,59 @@ class GradientBoostingModel(BaseModel):
         return self.model.predict(X)
 
 
+@register_model('svm')
 class SVMModel(BaseModel):
     """Support Vector Machine model for March Madness predictions."""
     
+    # Training rows above which the kernel SVM is replaced by a linear one, since
+    # libsvm's training time grows quadratically to cubically with the row count
+    max_kernel_samples = 20_000
+    
+    # SVC parameters that only apply to kernel SVMs and have no LinearSVC counterpart
+    kernel_only_params = frozenset({
+        'kernel', 'gamma', 'degree', 'coef0', 'shrinking', 'probability', 'cache_size',
+        'decision_function_shape', 'break_ties',
+    })
+    
+    def _linear_svc_params(self) -> Dict[str, Any]:
+        """
+        Translate the SVC model parameters into LinearSVC parameters.
+        
+        Returns:
+            Parameters for LinearSVC, without the kernel-only ones and with SVC's
+            max_iter=-1 ("no limit") replaced by LinearSVC's default limit
+        """
+        params = {name: value for name, value in self.model_params.items()
+                  if name not in self.kernel_only_params}
+        if params.get('max_iter') == -1:
+            del params['max_iter']
+        return {'dual': 'auto', **params}
+    
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the SVM model.
         
+        A linear kernel, or more than max_kernel_samples training rows, fits a
+        LinearSVC (liblinear) instead of a libsvm SVC, with the model parameters
+        translated by _linear_svc_params.
+        
         Args:
             X: Feature DataFrame
             y: Target Series
         """
-        self.model = SVC(**self.model_params)
-        self.model.fit(X, y)
+        if self.model_params.get('kernel', 'rbf') == 'linear' or len(X) > self.max_kernel_samples:
+            self.model = LinearSVC(**self._linear_svc_params())
+        else:
+            self.model = SVC(**self.model_params)
+        self.model.fit(self._prepare_features(X, fit=True), y)
         self.is_trained = True
     
-    def _predict_impl(self, X: pd.DataFrame) -> np.ndarray:
+    def _predict_impl(self, X: np.ndarray) -> np.ndarray:
         """
         Make predictions using the SVM model.
         
         Args:
-            X: Feature DataFrame
+            X: Feature array
             
         Returns:
             Array of predictions
@@ -251,14 +477,7 @@ def create_model(model_type: str, model_params: Optional[Dict[str, Any]] = None)
     Returns:
         Instantiated model of the specified type
     """
-    model_classes = {
-        'baseline': BaselineModel,
-        'random_forest': RandomForestModel,
-        'gradient_boosting': GradientBoostingModel,
-        'svm': SVMModel
-    }
-    
-    if model_type not in model_classes:
-        raise ValueError(f"Unknown model type: {model_type}. Must be one of {list(model_classes.keys())}")
+    if model_type not in _MODEL_CLASSES:
+        raise ValueError(f"Unknown model type: {model_type}. Must be one of {list(_MODEL_CLASSES.keys())}")
     
-    return model_classes[model_type](model_params) 
\ No newline at end of file
+    return _MODEL_CLASSES[model_type](model_params) 
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Shared pytest configuration for the March Madness tests."""
+import os
+import sys
+
+# The source modules import their siblings by module name, like the scripts do
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src", "data"))
+sys.path.insert(0, os.path.join(ROOT, "src", "models"))
@@ -0,0 +1,40 @@
+"""Tests for the data loading utilities."""
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+
+
+@pytest.fixture(autouse=True)
+def clear_loader_cache():
+    data_loader.clear_cache()
+    yield
+    data_loader.clear_cache()
+
+
+def _write_team_stats(path: str, team: str, mtime: float) -> None:
+    pd.DataFrame({"Team": [team], "PTS": [70.0]}).to_csv(path, index=False)
+    os.utime(path, (mtime, mtime))
+
+
+def test_newer_gzipped_csv_wins_over_stale_plain_csv(tmp_path):
+    year_dir = tmp_path / "2024"
+    year_dir.mkdir()
+    _write_team_stats(str(year_dir / "team_stats.csv"), "Old", 1_000_000)
+    _write_team_stats(str(year_dir / "team_stats.csv.gz"), "New", 2_000_000)
+    
+    df = data_loader.load_team_stats(2024, str(tmp_path))
+    
+    assert df["Team"].tolist() == ["New"]
+
+
+def test_newer_plain_csv_wins_over_stale_gzipped_csv(tmp_path):
+    year_dir = tmp_path / "2024"
+    year_dir.mkdir()
+    _write_team_stats(str(year_dir / "team_stats.csv.gz"), "Old", 1_000_000)
+    _write_team_stats(str(year_dir / "team_stats.csv"), "New", 2_000_000)
+    
+    assert data_loader._data_file_path(2024, str(tmp_path), "team_stats") == str(year_dir / "team_stats.csv")
+    assert data_loader.load_team_stats(2024, str(tmp_path))["Team"].tolist() == ["New"]
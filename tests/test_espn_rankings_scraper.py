@@ -0,0 +1,89 @@
+"""Tests for the ESPN rankings scraper."""
+import json
+
+import pytest
+
+from espn_rankings_scraper import ESPNMensBasketballRankingsScraperMCB
+
+
+def _rankings_page(polls, tables: str = "") -> bytes:
+    state = json.dumps({"page": {"content": {"rankings": polls}}})
+    return (f"<html><body><script>window['__espnfitt__']={state};</script>"
+            f"{tables}</body></html>").encode()
+
+
+def _rankings_table(rows) -> str:
+    body = "".join(
+        f'<tr><td><span>{rank}</span><span class="ml4">{team}</span></td>'
+        f"<td>{record}</td><td>{points}</td></tr>"
+        for rank, team, record, points in rows
+    )
+    return f'<div class="tabs__content"><table><tbody>{body}</tbody></table></div>'
+
+
+POLLS = [
+    {"type": "ap", "ranks": [
+        {"current": 1, "team": {"nickname": "Houston"}, "recordSummary": "30-4", "points": 1525.0},
+    ]},
+    {"type": "usa", "ranks": [
+        {"current": 1, "team": {"nickname": "UConn"}, "recordSummary": "31-3", "points": 800.0},
+    ]},
+]
+
+TABLES = (f'<section class="Rankings">{_rankings_table([("1", "Houston", "30-4", "1525")])}'
+          f'{_rankings_table([("1", "UConn", "31-3", "800")])}</section>')
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = ESPNMensBasketballRankingsScraperMCB(output_dir=str(tmp_path))
+    # Serve the page without a rendered table, so only the bootstrap JSON can be read
+    scraper._fetch = lambda url: _rankings_page(POLLS)
+    scraper.use_bootstrap = True
+    yield scraper
+    scraper.close()
+
+
+def test_single_poll_methods_read_the_bootstrap_json(scraper):
+    ap = scraper.scrape_ap_rankings(2024)
+    coaches = scraper.scrape_coaches_rankings(2024)
+    
+    assert ap["Team"].tolist() == ["Houston"]
+    assert ap["Poll"].tolist() == ["AP"]
+    assert coaches["Team"].tolist() == ["UConn"]
+    assert coaches["Poll"].tolist() == ["Coaches"]
+
+
+def test_single_poll_methods_match_scrape_all_rankings(scraper):
+    all_polls = scraper.scrape_all_rankings(2024)
+    
+    assert scraper.scrape_ap_rankings(2024).equals(all_polls["AP"])
+    assert scraper.scrape_coaches_rankings(2024).equals(all_polls["Coaches"])
+
+
+def test_bootstrap_and_table_parses_match(scraper):
+    page = _rankings_page(POLLS, TABLES)
+    
+    bootstrap = scraper._parse_all_polls(page, 2024)
+    scraper.use_bootstrap = False
+    tables = scraper._parse_all_polls(page, 2024)
+    
+    assert set(bootstrap) == set(tables) == {"AP", "Coaches"}
+    for poll_name in tables:
+        assert bootstrap[poll_name]["Team"].tolist() == tables[poll_name]["Team"].tolist()
+        assert bootstrap[poll_name].equals(tables[poll_name])
+
+
+def test_tables_are_read_by_default(tmp_path):
+    # The JSON nickname differs from the name the rendered table shows
+    polls = [{"type": "ap", "ranks": [
+        {"current": 1, "team": {"nickname": "Huskies"}, "recordSummary": "31-3", "points": 1525.0},
+    ]}]
+    table = _rankings_table([("1", "UConn", "31-3", "1525")])
+    page = _rankings_page(polls, f'<section class="Rankings">{table}</section>')
+    
+    with ESPNMensBasketballRankingsScraperMCB(output_dir=str(tmp_path)) as scraper:
+        scraper._fetch = lambda url: page
+        
+        assert scraper.scrape_ap_rankings(2024)["Team"].tolist() == ["UConn"]
+        assert scraper.scrape_all_rankings(2024)["AP"]["Team"].tolist() == ["UConn"]
@@ -0,0 +1,210 @@
+"""Tests for the shared ESPN scraper helpers."""
+import asyncio
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import espn_stats_scraper
+from espn_opponent_stats_scraper import _build_opponent_stats
+from espn_stats_scraper import ESPNStatsScraperBase, TokenBucket, coerce_numeric_columns
+
+
+def test_coerce_numeric_columns_keeps_numeric_looking_team_names():
+    df = pd.DataFrame({"Team": ["1", "2"], "PTS": ["1,024", "998"], "FG%": ["45.5%", "40"]})
+    
+    result = coerce_numeric_columns(df)
+    
+    assert result["Team"].tolist() == ["1", "2"]
+    assert not pd.api.types.is_numeric_dtype(result["Team"])
+    assert result["PTS"].tolist() == [1024, 998]
+    assert result["FG%"].tolist() == [45.5, 40.0]
+
+
+def test_build_opponent_stats_keeps_key_columns_as_text():
+    df = _build_opponent_stats(["76", "1861"], {"GP": ["30", "31"], "PTS": ["70.1", "65.2"]})
+    
+    assert df["Team"].tolist() == ["76", "1861"]
+    assert not pd.api.types.is_numeric_dtype(df["Team"])
+    assert df["StatsType"].tolist() == ["Opponent", "Opponent"]
+    assert df["PTS"].tolist() == [70.1, 65.2]
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+    
+    def __init__(self, body: bytes = b"<html></html>", status: int = 200):
+        self.status = status
+        self.headers = {}
+        self._body = body
+    
+    def raise_for_status(self):
+        pass
+    
+    async def read(self):
+        return self._body
+
+
+class _FakeRequest:
+    """Async context manager returned by _FakeSession.get."""
+    
+    def __init__(self, session):
+        self.session = session
+    
+    async def __aenter__(self):
+        self.session.request_times.append(time.monotonic())
+        if self.session.timeouts:
+            self.session.timeouts -= 1
+            raise asyncio.TimeoutError()
+        return _FakeResponse()
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class _FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession that records request times."""
+    
+    def __init__(self, timeouts: int = 0):
+        self.timeouts = timeouts
+        self.request_times = []
+    
+    def get(self, url, headers=None):
+        return _FakeRequest(self)
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    # Skip the jitter sleep between requests
+    monkeypatch.setattr(espn_stats_scraper.random, "uniform", lambda a, b: 0)
+    scraper = ESPNStatsScraperBase("https://www.espn.com/test", output_dir=str(tmp_path))
+    scraper.backoff_factor = 0.0
+    # The host rate limiters are shared by every scraper in the process
+    scraper.rate_limiters = {}
+    yield scraper
+    scraper.close()
+
+
+def test_afetch_retries_timeouts(scraper):
+    session = _FakeSession(timeouts=2)
+    
+    html = asyncio.run(scraper._afetch(session, "https://www.espn.com/a", asyncio.Semaphore(1)))
+    
+    assert html == b"<html></html>"
+    assert len(session.request_times) == 3
+
+
+def test_afetch_returns_none_after_repeated_timeouts(scraper):
+    session = _FakeSession(timeouts=scraper.max_retries + 1)
+    
+    html = asyncio.run(scraper._afetch(session, "https://www.espn.com/a", asyncio.Semaphore(1)))
+    
+    assert html is None
+    assert len(session.request_times) == scraper.max_retries + 1
+
+
+def test_afetch_is_throttled_by_the_host_rate_limiter(scraper):
+    # One request per 0.2s after the first
+    scraper.rate_limiters["www.espn.com"] = TokenBucket(capacity=1, period=0.2)
+    session = _FakeSession()
+    urls = [f"https://www.espn.com/{year}" for year in range(4)]
+    
+    async def fetch_all():
+        semaphore = asyncio.Semaphore(len(urls))
+        return await asyncio.gather(*(scraper._afetch(session, url, semaphore) for url in urls))
+    
+    pages = asyncio.run(fetch_all())
+    
+    assert all(page is not None for page in pages)
+    gaps = [later - earlier for earlier, later in zip(session.request_times, session.request_times[1:])]
+    assert all(gap >= 0.15 for gap in gaps)
+
+
+
+def test_saved_data_of_a_past_season_expires_if_saved_mid_season(scraper, tmp_path):
+    filename = "mens_basketball_team_stats_2020.parquet"
+    file_path = tmp_path / filename
+    file_path.write_bytes(b"")
+    mid_season = time.mktime((2020, 2, 1, 0, 0, 0, 0, 0, -1))
+    os.utime(file_path, (mid_season, mid_season))
+    
+    assert scraper._saved_max_age(2020, filename) == 7 * 86400.0
+    
+    after_season = time.mktime((2020, 6, 1, 0, 0, 0, 0, 0, -1))
+    os.utime(file_path, (after_season, after_season))
+    
+    assert scraper._saved_max_age(2020, filename) == float("inf")
+
+
+def test_chrome_driver_is_installed_once_by_concurrent_callers(monkeypatch):
+    installs = []
+    
+    class FakeChromeDriverManager:
+        def install(self):
+            installs.append(threading.get_ident())
+            # Give the other threads time to reach an uncached lookup
+            time.sleep(0.05)
+            return "/tmp/chromedriver"
+    
+    chrome = types.ModuleType("webdriver_manager.chrome")
+    chrome.ChromeDriverManager = FakeChromeDriverManager
+    monkeypatch.setitem(sys.modules, "webdriver_manager", types.ModuleType("webdriver_manager"))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", chrome)
+    espn_stats_scraper._install_chrome_driver.cache_clear()
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        paths = list(executor.map(lambda _: espn_stats_scraper.chrome_driver_path(), range(3)))
+    espn_stats_scraper._install_chrome_driver.cache_clear()
+    
+    assert paths == ["/tmp/chromedriver"] * 3
+    assert len(installs) == 1
+
+
+class _FakeRequestsResponse:
+    """Minimal stand-in for a requests response."""
+    
+    def __init__(self, status_code: int, content: bytes = b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+    
+    def raise_for_status(self):
+        pass
+
+
+class _FakeRequestsSession:
+    """Serves queued responses and records the headers of every request."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.request_headers = []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.request_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+    
+    def close(self):
+        pass
+
+
+def test_fetch_revalidates_an_expired_page_with_its_etag(tmp_path):
+    scraper = ESPNStatsScraperBase("https://www.espn.com/test", output_dir=str(tmp_path))
+    scraper.session = _FakeRequestsSession([
+        _FakeRequestsResponse(200, b"<html>v1</html>", {"ETag": '"v1"'}),
+        _FakeRequestsResponse(304),
+    ])
+    scraper.rate_limiters = {}
+    url = "https://www.espn.com/a"
+    
+    assert scraper._fetch(url) == b"<html>v1</html>"
+    # Let the cached page expire so the next fetch has to revalidate it
+    scraper.cache_ttl = -1.0
+    
+    assert scraper._fetch(url) == b"<html>v1</html>"
+    assert scraper.session.request_headers[1]["If-None-Match"] == '"v1"'
+    scraper.close()
@@ -0,0 +1,100 @@
+"""Tests for the model factory."""
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.svm import LinearSVC, SVC
+
+from model_factory import BaselineModel, GradientBoostingModel, SVMModel
+
+
+@pytest.fixture
+def games():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((200, 3)), columns=["seed_diff", "pts_diff", "rank_diff"])
+    y = pd.Series((X["seed_diff"] + rng.random(200) > 1).astype(int))
+    return X, y
+
+
+def test_svm_linear_kernel_translates_svc_params(games):
+    X, y = games
+    model = SVMModel({'kernel': 'linear', 'gamma': 'scale', 'degree': 3, 'max_iter': -1, 'C': 0.5})
+    
+    model.train(X, y)
+    
+    assert isinstance(model.model, LinearSVC)
+    assert model.model.max_iter == LinearSVC().max_iter
+    assert model.model.C == 0.5
+    assert model.predict(X).shape == (len(X),)
+
+
+def test_svm_large_training_set_switches_to_linear_svc(games):
+    X, y = games
+    model = SVMModel({'max_iter': -1, 'probability': True})
+    model.max_kernel_samples = 100
+    
+    model.train(X, y)
+    
+    assert isinstance(model.model, LinearSVC)
+
+
+def test_svm_small_training_set_keeps_kernel_svc(games):
+    X, y = games
+    model = SVMModel({'max_iter': -1})
+    
+    model.train(X, y)
+    
+    assert isinstance(model.model, SVC)
+    assert model.model.max_iter == -1
+
+
+def test_gradient_boosting_accepts_old_style_params(games):
+    X, y = games
+    model = GradientBoostingModel({
+        'n_estimators': 30, 'learning_rate': 0.1, 'max_depth': 3, 'min_samples_leaf': 0.05,
+        'subsample': 0.8, 'min_samples_split': 4, 'max_features': 'sqrt', 'criterion': 'friedman_mse',
+        'n_iter_no_change': None, 'random_state': 0,
+    })
+    
+    with pytest.warns(UserWarning) as record:
+        model.train(X, y)
+    
+    ignored = " ".join(str(warning.message) for warning in record)
+    for name in ('subsample', 'min_samples_split', 'max_features', 'criterion'):
+        assert name in ignored
+    assert model.model.max_iter == 30
+    assert model.model.max_depth == 3
+    assert model.model.min_samples_leaf == 10
+    assert model.predict(X).shape == (len(X),)
+
+
+def test_gradient_boosting_n_iter_no_change_enables_early_stopping(games):
+    X, y = games
+    model = GradientBoostingModel({'n_estimators': 30, 'n_iter_no_change': 5})
+    
+    model.train(X, y)
+    
+    assert model.model.early_stopping is True
+    assert model.model.n_iter_no_change == 5
+
+
+def test_baseline_fits_real_scale_features_without_convergence_warnings():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    X = pd.DataFrame({
+        # Season totals next to percentages, which unscaled saga does not converge on
+        "PTS": rng.normal(2300, 200, n),
+        "FG%": rng.normal(45, 3, n),
+        "REB": rng.normal(36, 4, n),
+        "Rank": rng.integers(1, 363, n).astype(float),
+    })
+    logit = 0.01 * (X["PTS"] - 2300) + 0.5 * (X["FG%"] - 45) - 0.01 * (X["Rank"] - 180)
+    y = pd.Series((rng.random(n) < 1 / (1 + np.exp(-logit))).astype(int))
+    model = BaselineModel()
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        model.train(X, y)
+    
+    assert model.evaluate(X, y)['accuracy'] > 0.7
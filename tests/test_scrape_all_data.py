@@ -0,0 +1,55 @@
+"""Tests for the scrape_all_data stages."""
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import scrape_all_data
+from espn_stats_scraper import ESPNStatsScraperBase
+
+
+def test_save_year_file_writes_zstd_parquet(tmp_path):
+    (tmp_path / "2020").mkdir()
+    df = pd.DataFrame({"Team": ["Duke", "UNC"], "PTS": [80.5, 77.0]})
+    
+    scrape_all_data._save_year_file(df, str(tmp_path), 2020, "team_stats", "parquet")
+    
+    year_file = tmp_path / "2020" / "team_stats.parquet"
+    assert sorted(path.name for path in (tmp_path / "2020").iterdir()) == ["team_stats.parquet"]
+    assert pq.ParquetFile(year_file).metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(year_file), df)
+
+
+@pytest.fixture
+def fetched_urls(monkeypatch):
+    urls = []
+    
+    async def fake_afetch(self, session, url, semaphore):
+        urls.append(url)
+        return None
+    
+    monkeypatch.setattr(ESPNStatsScraperBase, "_afetch", fake_afetch)
+    return urls
+
+
+@pytest.fixture
+def saved_team_stats(tmp_path):
+    # scrape_all_data creates the per-year directories before running the stages
+    (tmp_path / "2020").mkdir()
+    df = pd.DataFrame({"Team": ["Duke"], "PTS": [80.0]})
+    df.to_parquet(tmp_path / "mens_basketball_team_stats_2020.parquet")
+    return df
+
+
+def test_team_stats_stage_reuses_saved_data(tmp_path, fetched_urls, saved_team_stats):
+    results = scrape_all_data._scrape_team_stats_stage(2020, 2020, str(tmp_path), use_selenium=False)
+    
+    assert fetched_urls == []
+    pd.testing.assert_frame_equal(results[2020], saved_team_stats)
+
+
+def test_team_stats_stage_without_cache_ignores_saved_data(tmp_path, fetched_urls, saved_team_stats):
+    results = scrape_all_data._scrape_team_stats_stage(2020, 2020, str(tmp_path), use_selenium=False,
+                                                       use_cache=False)
+    
+    assert len(fetched_urls) == 1
+    assert results == {}